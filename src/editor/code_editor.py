@@ -3,6 +3,8 @@ SuperSupText - Code Editor Widget
 Main editor component with custom syntax highlighting (no QScintilla dependency)
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QTextEdit
 from PySide6.QtCore import Signal, Qt, QTimer, QRect, QSize, QRegularExpression
 from PySide6.QtGui import (
@@ -10,7 +12,18 @@ from PySide6.QtGui import (
     QSyntaxHighlighter, QTextDocument, QTextCursor, QPen, QFontMetrics
 )
 
-from ..utils.settings import Settings
+from ..utils.settings import get_settings
+
+
+@lru_cache(maxsize=32)
+def _find_regex(pattern: str, case_sensitive: bool) -> QRegularExpression:
+    """Build the regex for a find once per (pattern, case sensitivity)."""
+    # Same options as the search widget's match count, so both see the same words
+    options = QRegularExpression.PatternOption.UseUnicodePropertiesOption
+    if not case_sensitive:
+        # QTextDocument.find ignores FindCaseSensitively for regexes
+        options |= QRegularExpression.PatternOption.CaseInsensitiveOption
+    return QRegularExpression(pattern, options)
 
 
 class LineNumberArea(QWidget):
@@ -297,7 +310,7 @@ class CodeEditor(QPlainTextEdit):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.settings = Settings()
+        self.settings = get_settings()
         self._filepath = None
         self._encoding = 'utf-8'
         self._language = 'Text'
@@ -315,6 +328,9 @@ class CodeEditor(QPlainTextEdit):
         self._setup_line_number_area()
         self._apply_theme()
         self._connect_signals()
+        
+        # Follow setting changes made from the menus
+        self.settings.valueChanged.connect(self._on_setting_changed)
     
     def _toggle_cursor_blink(self):
         """Toggle cursor visibility for blinking effect."""
@@ -323,7 +339,11 @@ class CodeEditor(QPlainTextEdit):
     
     def _setup_editor(self):
         """Configure the editor settings."""
-        # Font
+        self._apply_font()
+        self._apply_word_wrap(self.settings.get('editor/word_wrap'))
+    
+    def _apply_font(self):
+        """Apply the configured font and the tab width derived from it."""
         font = self.settings.get_font()
         self.setFont(font)
         
@@ -331,13 +351,21 @@ class CodeEditor(QPlainTextEdit):
         tab_size = self.settings.get('editor/tab_size', 4)
         font_metrics = QFontMetrics(font)
         self.setTabStopDistance(font_metrics.horizontalAdvance(' ') * tab_size)
-        
-        # Word wrap - default to enabled for better readability
-        if self.settings.get('editor/word_wrap', True):
+    
+    def _apply_word_wrap(self, enabled: bool):
+        """Switch between wrapping at the widget width and no wrapping."""
+        if enabled:
             self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
         else:
             self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
     
+    def _on_setting_changed(self, key: str, value):
+        """Apply settings that affect the editor."""
+        if key == 'editor/word_wrap':
+            self._apply_word_wrap(bool(value))
+        elif key in ('editor/font_family', 'editor/font_size', 'editor/tab_size'):
+            self._apply_font()
+    
     # Drag and drop handling - forward file drops to main window
     def dragEnterEvent(self, event):
         """Handle drag enter - accept file drops."""
@@ -538,6 +566,10 @@ class CodeEditor(QPlainTextEdit):
         """Set the editor text."""
         self.setPlainText(text)
     
+    def revision(self) -> int:
+        """Get a counter that increases with every change to the text."""
+        return self.document().revision()
+    
     def isModified(self) -> bool:
         """Check if the document is modified."""
         return self.document().isModified()
@@ -564,6 +596,17 @@ class CodeEditor(QPlainTextEdit):
         self.setCursorPosition(line, 1)
         self.centerCursor()
     
+    def firstVisiblePosition(self) -> int:
+        """Get the document position where the viewport starts."""
+        return self.firstVisibleBlock().position()
+    
+    def textRange(self, start: int, end: int) -> str:
+        """Get the text between two document positions."""
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        return cursor.selection().toPlainText()
+    
     def selectedText(self) -> str:
         """Get selected text."""
         return self.textCursor().selectedText()
@@ -585,10 +628,12 @@ class CodeEditor(QPlainTextEdit):
         if not forward:
             flags |= QTextDocument.FindFlag.FindBackward
         
-        if regex:
-            found = self.document().find(QRegularExpression(text), self.textCursor(), flags)
-        else:
-            found = self.document().find(text, self.textCursor(), flags)
+        # The needle is built once and reused for the wrap-around search
+        needle = _find_regex(text, case_sensitive) if regex else text
+        if regex and not needle.isValid():
+            # A half-typed pattern such as "(ab"; don't walk the document for it
+            return False
+        found = self.document().find(needle, self.textCursor(), flags)
         
         if not found.isNull():
             self.setTextCursor(found)
@@ -602,10 +647,7 @@ class CodeEditor(QPlainTextEdit):
             cursor = QTextCursor(self.document())
             cursor.movePosition(QTextCursor.MoveOperation.End)
         
-        if regex:
-            found = self.document().find(QRegularExpression(text), cursor, flags)
-        else:
-            found = self.document().find(text, cursor, flags)
+        found = self.document().find(needle, cursor, flags)
         
         if not found.isNull():
             self.setTextCursor(found)
@@ -81,6 +81,9 @@ class SyntaxHighlighter:
         'light': LIGHT_THEME,
     }
     
+    # Parsed QColors per theme name, so hex strings are only parsed once
+    _qthemes = {}
+    
     @classmethod
     def get_theme(cls, name: str) -> dict:
         """Get a theme by name."""
@@ -89,14 +92,24 @@ class SyntaxHighlighter:
     @classmethod
     def get_color(cls, theme_name: str, color_name: str) -> QColor:
         """Get a specific color from a theme."""
-        theme = cls.get_theme(theme_name)
-        color_hex = theme.get(color_name, '#ffffff')
-        return QColor(color_hex)
+        colors = cls._qthemes.get(theme_name)
+        if colors is None:
+            colors = cls._qthemes[theme_name] = cls._to_qcolors(cls.get_theme(theme_name))
+        
+        color = colors.get(color_name)
+        # Hand out a copy so callers can't alter the cached color
+        return QColor(color) if color is not None else QColor('#ffffff')
     
     @classmethod
     def register_theme(cls, name: str, theme: dict):
         """Register a new theme."""
         cls._themes[name] = theme
+        cls._qthemes[name] = cls._to_qcolors(theme)
+    
+    @staticmethod
+    def _to_qcolors(theme: dict) -> dict:
+        """Parse every color of a theme into a QColor."""
+        return {key: QColor(value) for key, value in theme.items()}
     
     @classmethod
     def get_available_themes(cls) -> list:
@@ -5,7 +5,17 @@ A miniature preview of the code for quick navigation
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from PySide6.QtCore import Qt, Signal, QRect, QTimer
-from PySide6.QtGui import QPainter, QColor, QFont, QFontMetrics, QPen, QBrush
+from PySide6.QtGui import QPainter, QColor, QFont, QFontMetrics, QPen, QBrush, QImage
+
+
+# Theme colors, shared by every minimap instead of parsed per widget
+_BG_DARK = QColor("#1e1e1e")
+_TEXT_DARK = QColor("#808080")
+_VP_DARK = QColor("#ffffff")
+
+_BG_LIGHT = QColor("#f3f3f3")
+_TEXT_LIGHT = QColor("#a0a0a0")
+_VP_LIGHT = QColor("#000000")
 
 
 class MiniMap(QWidget):
@@ -20,7 +30,10 @@ class MiniMap(QWidget):
     def __init__(self, editor=None, parent=None):
         super().__init__(parent)
         self._editor = editor
-        self._lines = []
+        self._text_fn = None
+        self._first_visible_fn = None
+        self._height_fn = None
+        self._line_extents = []  # (indent, length) per line, None for blank lines
         self._visible_start = 0
         self._visible_end = 0
         self._total_lines = 0
@@ -28,11 +41,16 @@ class MiniMap(QWidget):
         self._char_width = 1
         self._dragging = False
         
+        # Cached image of the code lines, rebuilt only when text, size or theme change
+        self._static_layer = None
+        self._layer_buf = bytearray()
+        
         # Appearance
-        self._bg_color = QColor("#1e1e1e")
-        self._text_color = QColor("#808080")
-        self._viewport_color = QColor("#ffffff")
+        self._bg_color = _BG_DARK
+        self._text_color = _TEXT_DARK
+        self._viewport_color = _VP_DARK
         self._viewport_opacity = 30
+        self._update_overlay_colors()
         
         self.setFixedWidth(100)
         self.setMinimumHeight(100)
@@ -50,11 +68,17 @@ class MiniMap(QWidget):
         """Set the editor to track."""
         self._editor = editor
         
+        # Resolve editor accessors once instead of probing on every update
+        self._text_fn = getattr(editor, 'text', None)
+        self._first_visible_fn = getattr(editor, 'firstVisibleLine', None)
+        self._height_fn = editor.height
+        
         # Connect to editor signals
         if hasattr(editor, 'textChanged'):
             editor.textChanged.connect(self.scheduleUpdate)
         if hasattr(editor, 'cursorPositionChanged'):
-            editor.cursorPositionChanged.connect(self.scheduleUpdate)
+            # Cursor moves only shift the viewport band, the text is unchanged
+            editor.cursorPositionChanged.connect(self._update_viewport_only)
         
         self.updateContent()
     
@@ -73,86 +97,143 @@ class MiniMap(QWidget):
         
         # Get editor content
         try:
-            text = self._editor.text() if hasattr(self._editor, 'text') else ""
-            self._lines = text.split('\n')
-            self._total_lines = len(self._lines)
-            
-            # Get visible range from editor
-            if hasattr(self._editor, 'firstVisibleLine'):
-                self._visible_start = self._editor.firstVisibleLine()
-                # Estimate visible lines based on editor height
-                editor_height = self._editor.height()
-                line_height = 16  # Approximate
-                visible_count = max(1, editor_height // line_height)
-                self._visible_end = min(self._visible_start + visible_count, self._total_lines)
-            else:
-                self._visible_start = 0
-                self._visible_end = min(30, self._total_lines)
+            text = self._text_fn() if self._text_fn else ""
+            self._line_extents = self._compute_line_extents(text)
+            self._total_lines = len(self._line_extents)
+            self._update_viewport()
         except Exception:
-            self._lines = []
+            self._line_extents = []
             self._total_lines = 0
         
+        self._static_layer = None
+        self.update()
+    
+    @staticmethod
+    def _compute_line_extents(text: str) -> list:
+        """Measure indent and trimmed length of every line once per text change."""
+        extents = []
+        append = extents.append
+        for line in text.split('\n'):
+            trimmed = line.rstrip()
+            if trimmed:
+                append((len(trimmed) - len(trimmed.lstrip()), len(trimmed)))
+            else:
+                append(None)
+        return extents
+    
+    def _update_viewport_only(self):
+        """Move the viewport band without re-reading the editor text."""
+        if not self._editor:
+            return
+        
+        self._update_viewport()
         self.update()
     
+    def _update_viewport(self):
+        """Update the visible line range from the editor."""
+        if self._first_visible_fn:
+            self._visible_start = self._first_visible_fn()
+            # Estimate visible lines based on editor height
+            editor_height = self._height_fn()
+            line_height = 16  # Approximate
+            visible_count = max(1, editor_height // line_height)
+            self._visible_end = min(self._visible_start + visible_count, self._total_lines)
+        else:
+            self._visible_start = 0
+            self._visible_end = min(30, self._total_lines)
+    
     def paintEvent(self, event):
         """Paint the minimap."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         
-        # Background
-        painter.fillRect(self.rect(), self._bg_color)
+        if self._static_layer is None:
+            self._static_layer = self._render_static_layer()
+        painter.drawImage(0, 0, self._static_layer)
         
-        if not self._lines:
+        if not self._line_extents:
             return
         
-        # Calculate scaling
-        available_height = self.height()
-        content_height = self._total_lines * self._line_height
+        scaled_line_height = self._scaled_line_height()
         
-        if content_height > available_height:
-            scale = available_height / content_height
-        else:
-            scale = 1.0
+        # Draw viewport rectangle
+        if self._total_lines > 0:
+            viewport_y = self._visible_start * scaled_line_height
+            viewport_height = (self._visible_end - self._visible_start) * scaled_line_height
+            viewport_height = max(10, viewport_height)
+            
+            painter.fillRect(0, viewport_y, self.width(), viewport_height, self._viewport_fill)
+            
+            # Draw border
+            painter.setPen(self._viewport_pen)
+            painter.drawRect(0, viewport_y, self.width() - 1, viewport_height)
+    
+    def _render_static_layer(self) -> QImage:
+        """Render the background and code lines into an image in one pass."""
+        width = self.width()
+        height = self.height()
+        stride = width * 4
         
-        scaled_line_height = max(1, int(self._line_height * scale))
+        # Reuse the pixel buffer across renders while the size is unchanged
+        if len(self._layer_buf) != stride * height:
+            self._layer_buf = bytearray(stride * height)
+        buf = self._layer_buf
+        buf[:] = self._pixel(self._bg_color) * (width * height)
         
-        # Draw lines
-        painter.setPen(self._text_color)
+        text_pixel = self._pixel(self._text_color)
+        scaled_line_height = self._scaled_line_height()
+        max_chars = (width - 10) // self._char_width
         
-        max_chars = (self.width() - 10) // self._char_width
+        # Runs of lines with the same extent (indented bodies, comment blocks)
+        # share one span computation instead of rebuilding it per line
+        prev_extent = None
+        x = x_end = 0
+        span = b''
         
-        for i, line in enumerate(self._lines):
-            if i * scaled_line_height > available_height:
+        for i, extent in enumerate(self._line_extents):
+            y = i * scaled_line_height
+            if y >= height:
                 break
             
-            y = int(i * scaled_line_height)
+            if extent is None:
+                continue
             
-            if line.strip():
+            if extent != prev_extent:
                 # Draw a simplified representation of the line
-                indent = len(line) - len(line.lstrip())
-                content_length = min(len(line.rstrip()), max_chars)
+                indent, length = extent
+                content_length = min(length, max_chars)
                 
-                x = 5 + int(indent * self._char_width * 0.5)
-                width = max(2, int((content_length - indent) * self._char_width * 0.5))
-                
-                painter.drawLine(x, y, x + width, y)
-        
-        # Draw viewport rectangle
-        if self._total_lines > 0:
-            viewport_y = int(self._visible_start * scaled_line_height)
-            viewport_height = int((self._visible_end - self._visible_start) * scaled_line_height)
-            viewport_height = max(10, viewport_height)
+                x = 5 + indent * self._char_width // 2
+                line_width = max(2, (content_length - indent) * self._char_width // 2)
+                x_end = min(x + line_width + 1, width)
+                span = text_pixel * (x_end - x) if x < x_end else b''
+                prev_extent = extent
             
-            viewport_color = QColor(self._viewport_color)
-            viewport_color.setAlpha(self._viewport_opacity)
-            
-            painter.fillRect(0, viewport_y, self.width(), viewport_height, viewport_color)
-            
-            # Draw border
-            border_color = QColor(self._viewport_color)
-            border_color.setAlpha(60)
-            painter.setPen(QPen(border_color, 1))
-            painter.drawRect(0, viewport_y, self.width() - 1, viewport_height)
+            if span:
+                row = y * stride
+                buf[row + x * 4:row + x_end * 4] = span
+        
+        # Premultiplied storage lets Qt blit and blend the overlay on its fast path
+        return QImage(buf, width, height, stride, QImage.Format.Format_RGBA8888_Premultiplied)
+    
+    @staticmethod
+    def _pixel(color: QColor) -> bytes:
+        """Get the RGBA bytes of an opaque color (identical when premultiplied)."""
+        return bytes((color.red(), color.green(), color.blue(), 255))
+    
+    def _update_overlay_colors(self):
+        """Build the translucent viewport colors once per theme instead of per paint."""
+        self._viewport_fill = QColor(self._viewport_color)
+        self._viewport_fill.setAlpha(self._viewport_opacity)
+        
+        border_color = QColor(self._viewport_color)
+        border_color.setAlpha(60)
+        self._viewport_pen = QPen(border_color, 1)
+    
+    def resizeEvent(self, event):
+        """Invalidate the cached line layer on resize."""
+        super().resizeEvent(event)
+        self._static_layer = None
     
     def mousePressEvent(self, event):
         """Handle mouse press."""
@@ -174,32 +255,33 @@ class MiniMap(QWidget):
         if self._total_lines == 0:
             return
         
+        line = int(y) // self._scaled_line_height()
+        line = max(0, min(line, self._total_lines - 1))
+        
+        self.positionClicked.emit(line + 1)  # 1-indexed
+    
+    def _scaled_line_height(self) -> int:
+        """Get the per-line height in pixels, shrunk to fit long files."""
         available_height = self.height()
         content_height = self._total_lines * self._line_height
         
         if content_height > available_height:
-            scale = available_height / content_height
-        else:
-            scale = 1.0
-        
-        scaled_line_height = max(1, self._line_height * scale)
-        
-        line = int(y / scaled_line_height)
-        line = max(0, min(line, self._total_lines - 1))
-        
-        self.positionClicked.emit(line + 1)  # 1-indexed
+            return max(1, self._line_height * available_height // content_height)
+        return self._line_height
     
     def setTheme(self, theme_name: str):
         """Set the minimap theme."""
         if theme_name == 'light':
-            self._bg_color = QColor("#f3f3f3")
-            self._text_color = QColor("#a0a0a0")
-            self._viewport_color = QColor("#000000")
+            self._bg_color = _BG_LIGHT
+            self._text_color = _TEXT_LIGHT
+            self._viewport_color = _VP_LIGHT
         else:
-            self._bg_color = QColor("#1e1e1e")
-            self._text_color = QColor("#808080")
-            self._viewport_color = QColor("#ffffff")
+            self._bg_color = _BG_DARK
+            self._text_color = _TEXT_DARK
+            self._viewport_color = _VP_DARK
         
+        self._update_overlay_colors()
+        self._static_layer = None
         self.update()
     
     def setVisible(self, visible: bool):
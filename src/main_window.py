@@ -9,15 +9,193 @@ from PySide6.QtWidgets import (
     QMenuBar, QMenu, QToolBar, QStatusBar, QLabel, QFileDialog,
     QMessageBox, QInputDialog, QApplication
 )
-from PySide6.QtCore import Qt, QSize, Signal
+from PySide6.QtCore import Qt, QSize, Signal, QThreadPool, QTimer
 from PySide6.QtGui import QAction, QKeySequence, QIcon, QFont
 
 from .widgets.tab_widget import TabWidget
 from .widgets.file_tree import FileTree
 from .widgets.search_widget import SearchWidget
-from .utils.settings import Settings
+from .utils.settings import get_settings
 from .utils.file_utils import FileUtils
-from .utils.session_manager import SessionManager
+from .utils.session_manager import get_session_manager, SessionLoader
+
+
+# Static window stylesheet, kept at module level so it's built only once
+_MAINWINDOW_QSS = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    QMenuBar {
+        background-color: #3c3c3c;
+        color: #cccccc;
+        padding: 2px;
+    }
+    QMenuBar::item {
+        padding: 4px 10px;
+        border-radius: 3px;
+    }
+    QMenuBar::item:selected {
+        background-color: #505050;
+    }
+    QMenu {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #454545;
+    }
+    QMenu::item {
+        padding: 6px 30px 6px 20px;
+    }
+    QMenu::item:selected {
+        background-color: #094771;
+    }
+    QMenu::separator {
+        height: 1px;
+        background-color: #454545;
+        margin: 4px 0;
+    }
+    QSplitter::handle {
+        background-color: #1e1e1e;
+    }
+    QStatusBar {
+        background-color: #007acc;
+        color: #ffffff;
+    }
+    QStatusBar::item {
+        border: none;
+    }
+    QStatusBar QLabel {
+        padding: 2px 8px;
+    }
+"""
+
+
+# Number of entries shown in the Recent Files submenu
+_MAX_RECENT_ITEMS = 10
+
+# Settings read once while the main window is being built
+_STARTUP_SETTINGS = (
+    'window/geometry',
+    'window/state',
+    'window/sidebar_visible',
+    'window/sidebar_width',
+    'editor/show_minimap',
+    'editor/word_wrap',
+)
+
+# Menu specs: (title, shortcut, slot name); a None title adds a separator
+_SEPARATOR = (None, None, None)
+
+_FILE_MENU = (
+    ("&New File", QKeySequence.StandardKey.New, "_new_file"),
+    ("&Open File...", QKeySequence.StandardKey.Open, "_open_file"),
+    ("Open &Folder...", "Ctrl+K Ctrl+O", "_open_folder"),
+    _SEPARATOR,
+    ("&Save", QKeySequence.StandardKey.Save, "_save_file"),
+    ("Save &As...", QKeySequence.StandardKey.SaveAs, "_save_file_as"),
+    ("Save A&ll", "Ctrl+Shift+S", "_save_all"),
+    _SEPARATOR,
+)
+
+# File menu entries after the Recent Files submenu
+_FILE_MENU_END = (
+    _SEPARATOR,
+    ("&Close", QKeySequence.StandardKey.Close, "_close_tab"),
+    ("Close All", "Ctrl+Shift+W", "_close_all_tabs"),
+    _SEPARATOR,
+    ("E&xit", QKeySequence.StandardKey.Quit, "close"),
+)
+
+_EDIT_MENU = (
+    ("&Undo", QKeySequence.StandardKey.Undo, "_undo"),
+    ("&Redo", QKeySequence.StandardKey.Redo, "_redo"),
+    _SEPARATOR,
+    ("Cu&t", QKeySequence.StandardKey.Cut, "_cut"),
+    ("&Copy", QKeySequence.StandardKey.Copy, "_copy"),
+    ("&Paste", QKeySequence.StandardKey.Paste, "_paste"),
+    _SEPARATOR,
+    ("Select &All", QKeySequence.StandardKey.SelectAll, "_select_all"),
+    _SEPARATOR,
+    ("Toggle &Comment", "Ctrl+/", "_toggle_comment"),
+)
+
+_SELECTION_MENU = (
+    ("Select &Word", "Ctrl+D", "_select_next_occurrence"),
+    ("Select All &Occurrences", "Ctrl+Shift+L", "_select_all_occurrences"),
+    # Alt+F3 - Sublime Text style shortcut for Select All Occurrences
+    ("Select All (Alt+F3)", "Alt+F3", "_select_all_occurrences"),
+)
+
+_SEARCH_MENU = (
+    ("&Find", QKeySequence.StandardKey.Find, "_show_find"),
+    ("Find &Next", QKeySequence.StandardKey.FindNext, "_find_next"),
+    ("Find &Previous", QKeySequence.StandardKey.FindPrevious, "_find_prev"),
+    _SEPARATOR,
+    ("&Replace", QKeySequence.StandardKey.Replace, "_show_replace"),
+    _SEPARATOR,
+    ("&Go to Line...", "Ctrl+G", "_goto_line"),
+)
+
+_VIEW_MENU = (
+    ("Toggle &Sidebar", "Ctrl+B", "_toggle_sidebar"),
+    ("Toggle &Minimap", "Ctrl+Shift+M", "_toggle_minimap"),
+    _SEPARATOR,
+    ("Zoom &In", QKeySequence.StandardKey.ZoomIn, "_zoom_in"),
+    ("Zoom &Out", QKeySequence.StandardKey.ZoomOut, "_zoom_out"),
+    ("&Reset Zoom", "Ctrl+0", "_reset_zoom"),
+    _SEPARATOR,
+    ("&Word Wrap", None, "_toggle_word_wrap"),
+)
+
+_HELP_MENU = (
+    ("&About SuperSupText", None, "_show_about"),
+    ("&Keyboard Shortcuts", "Ctrl+Shift+/", "_show_shortcuts"),
+)
+
+
+# Help dialog contents
+_ABOUT_HTML = (
+    "<h2>SuperSupText</h2>"
+    "<p>Version 1.0.0</p>"
+    "<p>A lightweight, fast text editor inspired by Sublime Text.</p>"
+    "<p>Built with Python and PySide6.</p>"
+    "<hr>"
+    "<p><b>Features:</b></p>"
+    "<ul>"
+    "<li>Syntax highlighting for 15+ languages</li>"
+    "<li>Multiple tabs with easy navigation</li>"
+    "<li>File explorer sidebar</li>"
+    "<li>Search and replace with regex</li>"
+    "<li>Minimap for quick navigation</li>"
+    "<li>Multiple cursors support</li>"
+    "</ul>"
+)
+
+_SHORTCUTS_HTML = """
+    <h3>Keyboard Shortcuts</h3>
+    <table>
+    <tr><td><b>Ctrl+N</b></td><td>New File</td></tr>
+    <tr><td><b>Ctrl+O</b></td><td>Open File</td></tr>
+    <tr><td><b>Ctrl+S</b></td><td>Save</td></tr>
+    <tr><td><b>Ctrl+Shift+S</b></td><td>Save All</td></tr>
+    <tr><td><b>Ctrl+W</b></td><td>Close Tab</td></tr>
+    <tr><td colspan="2"><hr></td></tr>
+    <tr><td><b>Ctrl+F</b></td><td>Find</td></tr>
+    <tr><td><b>Ctrl+H</b></td><td>Replace</td></tr>
+    <tr><td><b>Ctrl+G</b></td><td>Go to Line</td></tr>
+    <tr><td><b>F3</b></td><td>Find Next</td></tr>
+    <tr><td><b>Shift+F3</b></td><td>Find Previous</td></tr>
+    <tr><td colspan="2"><hr></td></tr>
+    <tr><td><b>Ctrl+D</b></td><td>Select Next Occurrence</td></tr>
+    <tr><td><b>Ctrl+Shift+L</b></td><td>Select All Occurrences</td></tr>
+    <tr><td><b>Ctrl+/</b></td><td>Toggle Comment</td></tr>
+    <tr><td colspan="2"><hr></td></tr>
+    <tr><td><b>Ctrl+B</b></td><td>Toggle Sidebar</td></tr>
+    <tr><td><b>Ctrl+Shift+M</b></td><td>Toggle Minimap</td></tr>
+    <tr><td><b>Ctrl++</b></td><td>Zoom In</td></tr>
+    <tr><td><b>Ctrl+-</b></td><td>Zoom Out</td></tr>
+    <tr><td><b>Ctrl+0</b></td><td>Reset Zoom</td></tr>
+    </table>
+"""
 
 
 class MainWindow(QMainWindow):
@@ -34,8 +212,11 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.settings = Settings()
-        self.session_manager = SessionManager()
+        self.settings = get_settings()
+        self.session_manager = get_session_manager()
+        
+        # Settings needed while building the window, read in one go
+        self._startup_settings = self.settings.get_many(_STARTUP_SETTINGS)
         
         self._setup_window()
         self._setup_ui()
@@ -43,11 +224,16 @@ class MainWindow(QMainWindow):
         self._setup_shortcuts()
         self._setup_status_bar()
         self._connect_signals()
+        self._session_loader = None
         self._restore_state()
         
-        # Setup session manager and start autosave
+        # Setup session manager; autosave starts once every session tab is back
         self.session_manager.set_tab_widget(self.tab_widget)
-        self.session_manager.start_autosave()
+        if self._session_loader is None:
+            self.session_manager.start_autosave()
+        
+        # Session writes from closeEvent run in the background; flush them before exit
+        QApplication.instance().aboutToQuit.connect(self._wait_for_background_writes)
     
     def _setup_window(self):
         """Setup window properties."""
@@ -56,9 +242,10 @@ class MainWindow(QMainWindow):
         
         # Enable drag and drop
         self.setAcceptDrops(True)
+        self._drag_accept = False
         
         # Restore geometry
-        geometry = self.settings.get('window/geometry')
+        geometry = self._startup_settings['window/geometry']
         if geometry:
             self.restoreGeometry(geometry)
         else:
@@ -75,52 +262,7 @@ class MainWindow(QMainWindow):
     
     def _apply_style(self):
         """Apply global styles."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QMenuBar {
-                background-color: #3c3c3c;
-                color: #cccccc;
-                padding: 2px;
-            }
-            QMenuBar::item {
-                padding: 4px 10px;
-                border-radius: 3px;
-            }
-            QMenuBar::item:selected {
-                background-color: #505050;
-            }
-            QMenu {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #454545;
-            }
-            QMenu::item {
-                padding: 6px 30px 6px 20px;
-            }
-            QMenu::item:selected {
-                background-color: #094771;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #454545;
-                margin: 4px 0;
-            }
-            QSplitter::handle {
-                background-color: #1e1e1e;
-            }
-            QStatusBar {
-                background-color: #007acc;
-                color: #ffffff;
-            }
-            QStatusBar::item {
-                border: none;
-            }
-            QStatusBar QLabel {
-                padding: 2px 8px;
-            }
-        """)
+        self.setStyleSheet(_MAINWINDOW_QSS)
     
     def _setup_ui(self):
         """Setup the main UI layout."""
@@ -128,37 +270,53 @@ class MainWindow(QMainWindow):
         central = QWidget()
         self.setCentralWidget(central)
         
-        layout = QVBoxLayout(central)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
+        self._central_layout = QVBoxLayout(central)
+        self._central_layout.setContentsMargins(0, 0, 0, 0)
+        self._central_layout.setSpacing(0)
         
-        # Search widget (hidden by default)
-        self.search_widget = SearchWidget()
-        layout.addWidget(self.search_widget)
+        # Search widget, created on first find/replace
+        self.search_widget = None
         
         # Main splitter
         self.splitter = QSplitter(Qt.Orientation.Horizontal)
-        layout.addWidget(self.splitter)
-        
-        # File tree sidebar
-        self.file_tree = FileTree()
-        self.file_tree.setMinimumWidth(150)
-        self.file_tree.setMaximumWidth(500)
-        sidebar_width = self.settings.get('window/sidebar_width', 250)
-        self.file_tree.setFixedWidth(sidebar_width)
-        self.splitter.addWidget(self.file_tree)
-        
-        # Show/hide sidebar based on settings
-        if not self.settings.get('window/sidebar_visible', True):
-            self.file_tree.hide()
+        self._central_layout.addWidget(self.splitter)
         
         # Tab widget
         self.tab_widget = TabWidget()
         self.splitter.addWidget(self.tab_widget)
-        
-        # Set splitter sizes
-        self.splitter.setStretchFactor(0, 0)
-        self.splitter.setStretchFactor(1, 1)
+        self.splitter.setStretchFactor(0, 1)
+        
+        # File tree sidebar, only built at startup when it is shown
+        self.file_tree = None
+        if self._startup_settings['window/sidebar_visible']:
+            self._ensure_file_tree()
+    
+    def _ensure_search_widget(self) -> SearchWidget:
+        """Create the search widget on first use."""
+        if self.search_widget is None:
+            self.search_widget = SearchWidget()
+            self._central_layout.insertWidget(0, self.search_widget)
+            self.search_widget.closeRequested.connect(self._hide_search)
+        return self.search_widget
+    
+    def _ensure_file_tree(self) -> FileTree:
+        """Create the file tree sidebar on first use."""
+        if self.file_tree is None:
+            self.file_tree = FileTree()
+            self.file_tree.setMinimumWidth(150)
+            self.file_tree.setMaximumWidth(500)
+            sidebar_width = self.settings.get('window/sidebar_width', 250)
+            self.file_tree.setFixedWidth(sidebar_width)
+            self.splitter.insertWidget(0, self.file_tree)
+            self.splitter.setStretchFactor(0, 0)
+            
+            # Show/hide sidebar based on settings
+            if not self.settings.get('window/sidebar_visible', True):
+                self.file_tree.hide()
+            
+            self.file_tree.fileDoubleClicked.connect(self._open_file_path)
+            self.file_tree.hideRequested.connect(self._toggle_sidebar)
+        return self.file_tree
     
     def _setup_menus(self):
         """Setup the menu bar."""
@@ -166,180 +324,62 @@ class MainWindow(QMainWindow):
         
         # ===== File Menu =====
         file_menu = menubar.addMenu("&File")
-        
-        new_action = file_menu.addAction("&New File")
-        new_action.setShortcut(QKeySequence.StandardKey.New)
-        new_action.triggered.connect(self._new_file)
-        
-        open_action = file_menu.addAction("&Open File...")
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self._open_file)
-        
-        open_folder_action = file_menu.addAction("Open &Folder...")
-        open_folder_action.setShortcut("Ctrl+K Ctrl+O")
-        open_folder_action.triggered.connect(self._open_folder)
-        
-        file_menu.addSeparator()
-        
-        save_action = file_menu.addAction("&Save")
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.triggered.connect(self._save_file)
-        
-        save_as_action = file_menu.addAction("Save &As...")
-        save_as_action.setShortcut(QKeySequence.StandardKey.SaveAs)
-        save_as_action.triggered.connect(self._save_file_as)
-        
-        save_all_action = file_menu.addAction("Save A&ll")
-        save_all_action.setShortcut("Ctrl+Shift+S")
-        save_all_action.triggered.connect(self._save_all)
-        
-        file_menu.addSeparator()
+        self._build_menu(file_menu, _FILE_MENU)
         
         # Recent files submenu
         self.recent_menu = file_menu.addMenu("&Recent Files")
-        self._update_recent_menu()
+        self._setup_recent_menu()
+        # Refreshed when shown, so recent file changes don't touch it eagerly
+        self.recent_menu.aboutToShow.connect(self._update_recent_menu)
         
-        file_menu.addSeparator()
-        
-        close_action = file_menu.addAction("&Close")
-        close_action.setShortcut(QKeySequence.StandardKey.Close)
-        close_action.triggered.connect(self._close_tab)
-        
-        close_all_action = file_menu.addAction("Close All")
-        close_all_action.setShortcut("Ctrl+Shift+W")
-        close_all_action.triggered.connect(self._close_all_tabs)
-        
-        file_menu.addSeparator()
-        
-        exit_action = file_menu.addAction("E&xit")
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
+        self._build_menu(file_menu, _FILE_MENU_END)
         
         # ===== Edit Menu =====
-        edit_menu = menubar.addMenu("&Edit")
-        
-        undo_action = edit_menu.addAction("&Undo")
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.triggered.connect(self._undo)
-        
-        redo_action = edit_menu.addAction("&Redo")
-        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.triggered.connect(self._redo)
-        
-        edit_menu.addSeparator()
-        
-        cut_action = edit_menu.addAction("Cu&t")
-        cut_action.setShortcut(QKeySequence.StandardKey.Cut)
-        cut_action.triggered.connect(self._cut)
-        
-        copy_action = edit_menu.addAction("&Copy")
-        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
-        copy_action.triggered.connect(self._copy)
-        
-        paste_action = edit_menu.addAction("&Paste")
-        paste_action.setShortcut(QKeySequence.StandardKey.Paste)
-        paste_action.triggered.connect(self._paste)
-        
-        edit_menu.addSeparator()
-        
-        select_all_action = edit_menu.addAction("Select &All")
-        select_all_action.setShortcut(QKeySequence.StandardKey.SelectAll)
-        select_all_action.triggered.connect(self._select_all)
-        
-        edit_menu.addSeparator()
-        
-        toggle_comment_action = edit_menu.addAction("Toggle &Comment")
-        toggle_comment_action.setShortcut("Ctrl+/")
-        toggle_comment_action.triggered.connect(self._toggle_comment)
+        self._build_menu(menubar.addMenu("&Edit"), _EDIT_MENU)
         
         # ===== Selection Menu =====
-        selection_menu = menubar.addMenu("&Selection")
-        
-        select_word_action = selection_menu.addAction("Select &Word")
-        select_word_action.setShortcut("Ctrl+D")
-        select_word_action.triggered.connect(self._select_next_occurrence)
-        
-        select_all_occurrences_action = selection_menu.addAction("Select All &Occurrences")
-        select_all_occurrences_action.setShortcut("Ctrl+Shift+L")
-        select_all_occurrences_action.triggered.connect(self._select_all_occurrences)
-        
-        # Alt+F3 - Sublime Text style shortcut for Select All Occurrences
-        select_all_alt_action = selection_menu.addAction("Select All (Alt+F3)")
-        select_all_alt_action.setShortcut("Alt+F3")
-        select_all_alt_action.triggered.connect(self._select_all_occurrences)
+        self._build_menu(menubar.addMenu("&Selection"), _SELECTION_MENU)
         
         # ===== Search Menu =====
-        search_menu = menubar.addMenu("&Search")
-        
-        find_action = search_menu.addAction("&Find")
-        find_action.setShortcut(QKeySequence.StandardKey.Find)
-        find_action.triggered.connect(self._show_find)
-        
-        find_next_action = search_menu.addAction("Find &Next")
-        find_next_action.setShortcut(QKeySequence.StandardKey.FindNext)
-        find_next_action.triggered.connect(self._find_next)
-        
-        find_prev_action = search_menu.addAction("Find &Previous")
-        find_prev_action.setShortcut(QKeySequence.StandardKey.FindPrevious)
-        find_prev_action.triggered.connect(self._find_prev)
-        
-        search_menu.addSeparator()
-        
-        replace_action = search_menu.addAction("&Replace")
-        replace_action.setShortcut(QKeySequence.StandardKey.Replace)
-        replace_action.triggered.connect(self._show_replace)
-        
-        search_menu.addSeparator()
-        
-        goto_line_action = search_menu.addAction("&Go to Line...")
-        goto_line_action.setShortcut("Ctrl+G")
-        goto_line_action.triggered.connect(self._goto_line)
+        self._build_menu(menubar.addMenu("&Search"), _SEARCH_MENU)
         
         # ===== View Menu =====
-        view_menu = menubar.addMenu("&View")
+        view_actions = self._build_menu(menubar.addMenu("&View"), _VIEW_MENU)
         
-        self.sidebar_action = view_menu.addAction("Toggle &Sidebar")
-        self.sidebar_action.setShortcut("Ctrl+B")
+        self.sidebar_action = view_actions['_toggle_sidebar']
         self.sidebar_action.setCheckable(True)
-        self.sidebar_action.setChecked(self.settings.get('window/sidebar_visible', True))
-        self.sidebar_action.triggered.connect(self._toggle_sidebar)
+        self.sidebar_action.setChecked(self._startup_settings['window/sidebar_visible'])
         
-        self.minimap_action = view_menu.addAction("Toggle &Minimap")
-        self.minimap_action.setShortcut("Ctrl+Shift+M")
+        self.minimap_action = view_actions['_toggle_minimap']
         self.minimap_action.setCheckable(True)
-        self.minimap_action.setChecked(self.settings.get('editor/show_minimap', True))
-        self.minimap_action.triggered.connect(self._toggle_minimap)
-        
-        view_menu.addSeparator()
+        self.minimap_action.setChecked(self._startup_settings['editor/show_minimap'])
         
-        zoom_in_action = view_menu.addAction("Zoom &In")
-        zoom_in_action.setShortcut(QKeySequence.StandardKey.ZoomIn)
-        zoom_in_action.triggered.connect(self._zoom_in)
-        
-        zoom_out_action = view_menu.addAction("Zoom &Out")
-        zoom_out_action.setShortcut(QKeySequence.StandardKey.ZoomOut)
-        zoom_out_action.triggered.connect(self._zoom_out)
-        
-        reset_zoom_action = view_menu.addAction("&Reset Zoom")
-        reset_zoom_action.setShortcut("Ctrl+0")
-        reset_zoom_action.triggered.connect(self._reset_zoom)
-        
-        view_menu.addSeparator()
-        
-        word_wrap_action = view_menu.addAction("&Word Wrap")
+        word_wrap_action = view_actions['_toggle_word_wrap']
         word_wrap_action.setCheckable(True)
-        word_wrap_action.setChecked(self.settings.get('editor/word_wrap', False))
-        word_wrap_action.triggered.connect(self._toggle_word_wrap)
+        word_wrap_action.setChecked(self._startup_settings['editor/word_wrap'])
         
         # ===== Help Menu =====
-        help_menu = menubar.addMenu("&Help")
-        
-        about_action = help_menu.addAction("&About SuperSupText")
-        about_action.triggered.connect(self._show_about)
+        self._build_menu(menubar.addMenu("&Help"), _HELP_MENU)
+    
+    def _build_menu(self, menu: QMenu, spec: tuple) -> dict:
+        """
+        Add the actions described by a menu spec to a menu.
         
-        keyboard_shortcuts_action = help_menu.addAction("&Keyboard Shortcuts")
-        keyboard_shortcuts_action.setShortcut("Ctrl+Shift+/")
-        keyboard_shortcuts_action.triggered.connect(self._show_shortcuts)
+        Returns:
+            Dict mapping slot name to the created action
+        """
+        actions = {}
+        for title, shortcut, slot in spec:
+            if title is None:
+                menu.addSeparator()
+                continue
+            
+            action = menu.addAction(title)
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(self, slot))
+            actions[slot] = action
+        return actions
     
     def _setup_shortcuts(self):
         """Setup additional keyboard shortcuts."""
@@ -354,6 +394,13 @@ class MainWindow(QMainWindow):
         self.cursor_label = QLabel("Ln 1, Col 1")
         self.status_bar.addPermanentWidget(self.cursor_label)
         
+        # Coalesces bursts of cursor moves into one label update per frame
+        self._pending_cursor = (1, 1)
+        self._cursor_label_timer = QTimer(self)
+        self._cursor_label_timer.setSingleShot(True)
+        self._cursor_label_timer.setInterval(16)
+        self._cursor_label_timer.timeout.connect(self._flush_cursor_label)
+        
         # Language
         self.language_label = QLabel("Plain Text")
         self.status_bar.addPermanentWidget(self.language_label)
@@ -364,105 +411,142 @@ class MainWindow(QMainWindow):
     
     def _connect_signals(self):
         """Connect signals."""
-        # File tree
-        self.file_tree.fileDoubleClicked.connect(self._open_file_path)
-        self.file_tree.hideRequested.connect(self._toggle_sidebar)
-        
         # Tab widget
+        self._last_file_signal = None  # (filepath, editor) last handled
         self.tab_widget.currentFileChanged.connect(self._on_file_changed)
-        
-        # Search widget
-        self.search_widget.closeRequested.connect(self._hide_search)
+        self.tab_widget.currentCursorChanged.connect(self._on_cursor_changed)
+        self._pending_restore_cursors = {}  # container -> (line, column) once its file loads
+        self.tab_widget.fileLoaded.connect(self._on_file_loaded)
     
     def _restore_state(self):
         """Restore session state including unsaved buffers."""
         # Restore window state
-        state = self.settings.get('window/state')
+        state = self._startup_settings['window/state']
         if state:
             self.restoreState(state)
         
-        # Restore session from session manager (includes unsaved buffers)
+        # Restore session from session manager (includes unsaved buffers).
+        # Only the session metadata is read here; file checks and buffer reads
+        # run on a worker so the window can paint first.
         tabs_data, current_tab = self.session_manager.load_session()
         
-        if tabs_data:
-            for tab_data in tabs_data:
-                filepath = tab_data.get('filepath')
-                buffer_id = tab_data.get('buffer_id')
-                title = tab_data.get('title')
-                
-                if filepath and os.path.exists(filepath):
-                    # Open existing file
-                    index = self.tab_widget.newTab(filepath)
-                    
-                    # If there's a modified buffer, restore it
-                    if buffer_id and tab_data.get('modified'):
-                        editor = self.tab_widget.editorAt(index)
-                        if editor:
-                            content = self.session_manager.get_buffer_content(buffer_id)
-                            if content:
-                                editor.setText(content)
-                                editor._buffer_id = buffer_id
-                else:
-                    # Unsaved buffer - create new tab and restore content
-                    index = self.tab_widget.newTab()
-                    editor = self.tab_widget.editorAt(index)
-                    
-                    if editor and buffer_id:
-                        content = self.session_manager.get_buffer_content(buffer_id)
-                        if content:
-                            editor.setText(content)
-                            editor._buffer_id = buffer_id
-                        
-                        # Set language if available
-                        if tab_data.get('language'):
-                            editor.set_language(tab_data['language'])
-                    
-                    # Restore tab title
-                    if title:
-                        self.tab_widget.setTabText(index, title)
+        if not tabs_data:
+            self.tab_widget.newTab()
+            return
+        
+        self._session_loader = SessionLoader(self.session_manager, tabs_data, current_tab)
+        self._session_loader.signals.tabReady.connect(self._apply_restored_tab)
+        self._session_loader.signals.finished.connect(self._on_session_restored)
+        QThreadPool.globalInstance().start(self._session_loader)
+    
+    def _apply_restored_tab(self, tab_data: dict, content: str):
+        """Create a tab for a session entry prepared by the loader."""
+        filepath = tab_data.get('filepath')
+        buffer_id = tab_data.get('buffer_id')
+        title = tab_data.get('title')
+        
+        if tab_data.get('exists'):
+            # Open existing file
+            index = self.tab_widget.newTab(filepath)
+            
+            # If there's a modified buffer, restore it
+            if buffer_id and tab_data.get('modified'):
+                editor = self.tab_widget.editorAt(index)
+                if editor and content:
+                    editor.setText(content)
+                    editor.parent().restored_buffer = True
+                    self.session_manager.set_buffer_id(editor, buffer_id)
+        else:
+            # Unsaved buffer - create new tab and restore content
+            index = self.tab_widget.newTab()
+            editor = self.tab_widget.editorAt(index)
+            
+            if editor and buffer_id:
+                if content:
+                    editor.setText(content)
+                    self.session_manager.set_buffer_id(editor, buffer_id)
                 
-                # Restore cursor position
-                if index >= 0:
-                    editor = self.tab_widget.editorAt(index)
-                    if editor:
-                        line = tab_data.get('cursor_line', 1)
-                        col = tab_data.get('cursor_column', 1)
-                        editor.setCursorPosition(line, col)
+                # Set language if available
+                if tab_data.get('language'):
+                    editor.set_language(tab_data['language'])
             
-            # Restore current tab
-            if current_tab < self.tab_widget.count():
-                self.tab_widget.setCurrentIndex(current_tab)
+            # Restore tab title
+            if title:
+                self.tab_widget.setTabText(index, title)
+        
+        # Restore cursor position
+        if index >= 0:
+            editor = self.tab_widget.editorAt(index)
+            if editor:
+                line = tab_data.get('cursor_line', 1)
+                col = tab_data.get('cursor_column', 1)
+                if self.tab_widget.isLoading(index) and not editor.parent().restored_buffer:
+                    self._pending_restore_cursors[editor.parent()] = (line, col)
+                else:
+                    editor.setCursorPosition(line, col)
+    
+    def _on_file_loaded(self, container):
+        """Restore the saved cursor of a session tab once its file is read."""
+        position = self._pending_restore_cursors.pop(container, None)
+        if position:
+            container.editor.setCursorPosition(*position)
+    
+    def _on_session_restored(self, current_tab: int):
+        """Select the saved current tab once every session tab is open."""
+        self._session_loader = None
+        # Until now a snapshot would have dropped the tabs not yet delivered
+        self.session_manager.start_autosave()
+        
+        # Restore current tab
+        if current_tab < self.tab_widget.count():
+            self.tab_widget.setCurrentIndex(current_tab)
         
         # If no tabs, create empty tab
         if self.tab_widget.count() == 0:
             self.tab_widget.newTab()
     
-    def _update_recent_menu(self):
-        """Update the recent files menu."""
-        self.recent_menu.clear()
-        
-        recent_files = self.settings.get_recent_files()
+    def _setup_recent_menu(self):
+        """Create the recent files actions once; they're updated in place when shown."""
+        self._no_recent_action = self.recent_menu.addAction("No Recent Files")
+        self._no_recent_action.setEnabled(False)
         
-        if not recent_files:
-            no_recent = self.recent_menu.addAction("No Recent Files")
-            no_recent.setEnabled(False)
-            return
-        
-        for filepath in recent_files[:10]:
-            action = self.recent_menu.addAction(os.path.basename(filepath))
-            action.setData(filepath)
-            action.setToolTip(filepath)
-            action.triggered.connect(lambda checked, f=filepath: self._open_file_path(f))
+        self._recent_actions = []
+        for _ in range(_MAX_RECENT_ITEMS):
+            action = self.recent_menu.addAction("")
+            action.triggered.connect(self._open_recent)
+            self._recent_actions.append(action)
         
-        self.recent_menu.addSeparator()
+        self._recent_separator = self.recent_menu.addSeparator()
         
-        clear_action = self.recent_menu.addAction("Clear Recent Files")
-        clear_action.triggered.connect(self._clear_recent)
+        self._clear_recent_action = self.recent_menu.addAction("Clear Recent Files")
+        self._clear_recent_action.triggered.connect(self._clear_recent)
+    
+    def _update_recent_menu(self):
+        """Update the recent files menu."""
+        recent_files = self.settings.get_recent_files()[:_MAX_RECENT_ITEMS]
+        
+        for i, action in enumerate(self._recent_actions):
+            if i < len(recent_files):
+                filepath = recent_files[i]
+                action.setText(os.path.basename(filepath))
+                action.setData(filepath)
+                action.setToolTip(filepath)
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
+        
+        has_recent = bool(recent_files)
+        self._no_recent_action.setVisible(not has_recent)
+        self._recent_separator.setVisible(has_recent)
+        self._clear_recent_action.setVisible(has_recent)
+    
+    def _open_recent(self):
+        """Open the recent file stored on the triggering action."""
+        self._open_file_path(self.sender().data())
     
     def _clear_recent(self):
         """Clear recent files."""
         self.settings.clear_recent_files()
-        self._update_recent_menu()
     
     # ===== File Actions =====
     
@@ -486,7 +570,6 @@ class MainWindow(QMainWindow):
         """Open a specific file."""
         self.tab_widget.newTab(filepath)
         self.settings.set('files/last_directory', os.path.dirname(filepath))
-        self._update_recent_menu()
     
     def _open_folder(self):
         """Open a folder."""
@@ -498,7 +581,7 @@ class MainWindow(QMainWindow):
         )
         
         if folder:
-            self.file_tree.openFolder(folder)
+            self._ensure_file_tree().openFolder(folder)
     
     def _save_file(self):
         """Save the current file."""
@@ -510,10 +593,24 @@ class MainWindow(QMainWindow):
     
     def _save_all(self):
         """Save all open files."""
-        for i in range(self.tab_widget.count()):
-            editor = self.tab_widget.editorAt(i)
-            if editor and editor.isModified():
-                self.tab_widget.saveTab(i)
+        # Collect dirty tabs in one pass; untitled ones need a dialog each
+        with_path = []
+        untitled = []
+        for i, editor in enumerate(self.tab_widget.editors()):
+            if editor.isModified():
+                (with_path if editor.filepath else untitled).append(i)
+        
+        # Save files without repainting the tab bar after every title change
+        if with_path:
+            self.tab_widget.setUpdatesEnabled(False)
+            try:
+                for i in with_path:
+                    self.tab_widget.saveTab(i)
+            finally:
+                self.tab_widget.setUpdatesEnabled(True)
+        
+        for i in untitled:
+            self.tab_widget.saveTab(i)
     
     def _close_tab(self):
         """Close the current tab."""
@@ -521,9 +618,7 @@ class MainWindow(QMainWindow):
     
     def _close_all_tabs(self):
         """Close all tabs."""
-        for i in range(self.tab_widget.count() - 1, -1, -1):
-            if not self.tab_widget.closeTab(i):
-                break
+        self.tab_widget.closeTabs(range(self.tab_widget.count()))
     
     # ===== Edit Actions =====
     
@@ -531,18 +626,25 @@ class MainWindow(QMainWindow):
         """Get the current editor."""
         return self.tab_widget.currentEditor()
     
+    def _get_editable_editor(self):
+        """Get the current editor, or None while its file is still loading."""
+        # Read-only stops typing only; programmatic edits would land in the placeholder
+        if self.tab_widget.isLoading(self.tab_widget.currentIndex()):
+            return None
+        return self.tab_widget.currentEditor()
+    
     def _undo(self):
-        editor = self._get_current_editor()
+        editor = self._get_editable_editor()
         if editor:
             editor.undo()
     
     def _redo(self):
-        editor = self._get_current_editor()
+        editor = self._get_editable_editor()
         if editor:
             editor.redo()
     
     def _cut(self):
-        editor = self._get_current_editor()
+        editor = self._get_editable_editor()
         if editor:
             editor.cut()
     
@@ -552,7 +654,7 @@ class MainWindow(QMainWindow):
             editor.copy()
     
     def _paste(self):
-        editor = self._get_current_editor()
+        editor = self._get_editable_editor()
         if editor:
             editor.paste()
     
@@ -562,7 +664,7 @@ class MainWindow(QMainWindow):
             editor.selectAll()
     
     def _toggle_comment(self):
-        editor = self._get_current_editor()
+        editor = self._get_editable_editor()
         if editor:
             editor.toggleComment()
     
@@ -584,25 +686,30 @@ class MainWindow(QMainWindow):
         """Show the find panel."""
         editor = self._get_current_editor()
         if editor:
-            self.search_widget.setEditor(editor)
-            self.search_widget.showFind()
+            search_widget = self._ensure_search_widget()
+            search_widget.setEditor(editor)
+            search_widget.showFind()
     
     def _show_replace(self):
         """Show the replace panel."""
-        editor = self._get_current_editor()
+        editor = self._get_editable_editor()
         if editor:
-            self.search_widget.setEditor(editor)
-            self.search_widget.showReplace()
+            search_widget = self._ensure_search_widget()
+            search_widget.setEditor(editor)
+            search_widget.showReplace()
     
     def _hide_search(self):
         """Hide the search panel."""
-        self.search_widget.hide()
+        if self.search_widget is not None:
+            self.search_widget.hide()
     
     def _find_next(self):
-        self.search_widget._find_next()
+        if self.search_widget is not None:
+            self.search_widget._find_next()
     
     def _find_prev(self):
-        self.search_widget._find_prev()
+        if self.search_widget is not None:
+            self.search_widget._find_prev()
     
     def _goto_line(self):
         """Go to a specific line."""
@@ -625,22 +732,17 @@ class MainWindow(QMainWindow):
     
     def _toggle_sidebar(self):
         """Toggle the sidebar visibility."""
-        visible = self.file_tree.isVisible()
-        self.file_tree.setVisible(not visible)
+        visible = self.file_tree is not None and self.file_tree.isVisible()
+        self._ensure_file_tree().setVisible(not visible)
         self.sidebar_action.setChecked(not visible)
         self.settings.set('window/sidebar_visible', not visible)
     
     def _toggle_minimap(self):
         """Toggle the minimap visibility."""
+        # Open editors follow the setting through Settings.valueChanged
         visible = self.settings.get('editor/show_minimap', True)
         self.settings.set('editor/show_minimap', not visible)
         self.minimap_action.setChecked(not visible)
-        
-        # Update all open editors
-        for i in range(self.tab_widget.count()):
-            container = self.tab_widget.widget(i)
-            if container and hasattr(container, 'minimap'):
-                container.minimap.setVisible(not visible)
     
     def _zoom_in(self):
         editor = self._get_current_editor()
@@ -659,119 +761,94 @@ class MainWindow(QMainWindow):
     
     def _toggle_word_wrap(self):
         """Toggle word wrap."""
+        # Open editors follow the setting through Settings.valueChanged
         current = self.settings.get('editor/word_wrap', False)
         self.settings.set('editor/word_wrap', not current)
-        # Would need to update all editors
     
     # ===== Help Actions =====
     
     def _show_about(self):
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About SuperSupText",
-            "<h2>SuperSupText</h2>"
-            "<p>Version 1.0.0</p>"
-            "<p>A lightweight, fast text editor inspired by Sublime Text.</p>"
-            "<p>Built with Python and PySide6.</p>"
-            "<hr>"
-            "<p><b>Features:</b></p>"
-            "<ul>"
-            "<li>Syntax highlighting for 15+ languages</li>"
-            "<li>Multiple tabs with easy navigation</li>"
-            "<li>File explorer sidebar</li>"
-            "<li>Search and replace with regex</li>"
-            "<li>Minimap for quick navigation</li>"
-            "<li>Multiple cursors support</li>"
-            "</ul>"
-        )
+        QMessageBox.about(self, "About SuperSupText", _ABOUT_HTML)
     
     def _show_shortcuts(self):
         """Show keyboard shortcuts dialog."""
-        shortcuts = """
-        <h3>Keyboard Shortcuts</h3>
-        <table>
-        <tr><td><b>Ctrl+N</b></td><td>New File</td></tr>
-        <tr><td><b>Ctrl+O</b></td><td>Open File</td></tr>
-        <tr><td><b>Ctrl+S</b></td><td>Save</td></tr>
-        <tr><td><b>Ctrl+Shift+S</b></td><td>Save All</td></tr>
-        <tr><td><b>Ctrl+W</b></td><td>Close Tab</td></tr>
-        <tr><td colspan="2"><hr></td></tr>
-        <tr><td><b>Ctrl+F</b></td><td>Find</td></tr>
-        <tr><td><b>Ctrl+H</b></td><td>Replace</td></tr>
-        <tr><td><b>Ctrl+G</b></td><td>Go to Line</td></tr>
-        <tr><td><b>F3</b></td><td>Find Next</td></tr>
-        <tr><td><b>Shift+F3</b></td><td>Find Previous</td></tr>
-        <tr><td colspan="2"><hr></td></tr>
-        <tr><td><b>Ctrl+D</b></td><td>Select Next Occurrence</td></tr>
-        <tr><td><b>Ctrl+Shift+L</b></td><td>Select All Occurrences</td></tr>
-        <tr><td><b>Ctrl+/</b></td><td>Toggle Comment</td></tr>
-        <tr><td colspan="2"><hr></td></tr>
-        <tr><td><b>Ctrl+B</b></td><td>Toggle Sidebar</td></tr>
-        <tr><td><b>Ctrl+Shift+M</b></td><td>Toggle Minimap</td></tr>
-        <tr><td><b>Ctrl++</b></td><td>Zoom In</td></tr>
-        <tr><td><b>Ctrl+-</b></td><td>Zoom Out</td></tr>
-        <tr><td><b>Ctrl+0</b></td><td>Reset Zoom</td></tr>
-        </table>
-        """
-        QMessageBox.information(self, "Keyboard Shortcuts", shortcuts)
+        QMessageBox.information(self, "Keyboard Shortcuts", _SHORTCUTS_HTML)
     
     # ===== Event Handlers =====
     
     def _on_file_changed(self, filepath: str):
         """Handle file change."""
+        editor = self._get_current_editor()
+        
+        # Same file in the same editor again: only the cursor can be stale
+        if (filepath, editor) == self._last_file_signal:
+            if editor:
+                line, col = editor.getCursorPosition()
+                self._on_cursor_changed(line, col)
+            return
+        self._last_file_signal = (filepath, editor)
+        
         if filepath:
             self.setWindowTitle(f"{os.path.basename(filepath)} - SuperSupText")
             language = FileUtils.get_language_from_extension(filepath)
             self.language_label.setText(language)
             
             # Update search widget editor reference
-            editor = self._get_current_editor()
             if editor:
-                self.search_widget.setEditor(editor)
+                if self.search_widget is not None:
+                    self.search_widget.setEditor(editor)
                 
                 # Update cursor position
                 line, col = editor.getCursorPosition()
-                self.cursor_label.setText(f"Ln {line}, Col {col}")
+                self._on_cursor_changed(line, col)
                 
                 # Update encoding
                 self.encoding_label.setText(editor.encoding.upper())
-                
-                # Connect cursor position signal (safely disconnect first)
-                try:
-                    editor.cursorPositionChanged_custom.disconnect(self._on_cursor_changed)
-                except (TypeError, RuntimeError):
-                    pass  # Not connected
-                editor.cursorPositionChanged_custom.connect(self._on_cursor_changed)
         else:
             self.setWindowTitle("SuperSupText")
             self.language_label.setText("Plain Text")
     
     def _on_cursor_changed(self, line: int, column: int):
         """Handle cursor position change."""
+        self._pending_cursor = (line, column)
+        if not self._cursor_label_timer.isActive():
+            self._cursor_label_timer.start()
+    
+    def _flush_cursor_label(self):
+        """Show the latest cursor position in the status bar."""
+        line, column = self._pending_cursor
         self.cursor_label.setText(f"Ln {line}, Col {column}")
     
     # ===== Drag and Drop =====
     
     def dragEnterEvent(self, event):
         """Handle drag enter event."""
-        if event.mimeData().hasUrls():
-            # Check if any URL is a file
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
+        # Decide once per drag; move events then just reuse the answer
+        mime_data = event.mimeData()
+        self._drag_accept = mime_data.hasUrls() and any(
+            url.isLocalFile() for url in mime_data.urls()
+        )
+        if self._drag_accept:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
     
     def dragMoveEvent(self, event):
         """Handle drag move event."""
-        if event.mimeData().hasUrls():
+        if self._drag_accept:
             event.acceptProposedAction()
         else:
             event.ignore()
     
+    def dragLeaveEvent(self, event):
+        """Handle drag leave event."""
+        self._drag_accept = False
+        super().dragLeaveEvent(event)
+    
     def dropEvent(self, event):
         """Handle drop event - open dropped files."""
+        self._drag_accept = False
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 if url.isLocalFile():
@@ -780,7 +857,7 @@ class MainWindow(QMainWindow):
                         self._open_file_path(filepath)
                     elif os.path.isdir(filepath):
                         # If a folder is dropped, open it in the file tree
-                        self.file_tree.openFolder(filepath)
+                        self._ensure_file_tree().openFolder(filepath)
             event.acceptProposedAction()
         else:
             event.ignore()
@@ -790,15 +867,24 @@ class MainWindow(QMainWindow):
         # Stop autosave timer
         self.session_manager.stop_autosave()
         
-        # Save session (includes all unsaved buffers)
-        self.session_manager.save_session()
-        
-        # Save window state
-        self.settings.set('window/geometry', self.saveGeometry())
-        self.settings.set('window/state', self.saveState())
-        self.settings.set('window/sidebar_width', self.file_tree.width())
-        
-        # Also save file paths for backward compatibility
-        self.settings.save_session(self.tab_widget.getOpenFiles())
+        # Save session (includes all unsaved buffers). The tab contents are
+        # captured here, the disk writes happen on a worker thread. Mid-restore
+        # the session on disk is still the complete one, so it is left as is.
+        if self._session_loader is None:
+            self.session_manager.save_session_async()
+        
+        # Save window state, plus file paths for backward compatibility
+        window_settings = {
+            'window/geometry': self.saveGeometry(),
+            'window/state': self.saveState(),
+            'files/session': self.tab_widget.getOpenFiles(),
+        }
+        if self.file_tree is not None:
+            window_settings['window/sidebar_width'] = self.file_tree.width()
+        self.settings.update(window_settings)
         
         event.accept()
+    
+    def _wait_for_background_writes(self):
+        """Give pending session writes a chance to finish before the process exits."""
+        QThreadPool.globalInstance().waitForDone(2000)
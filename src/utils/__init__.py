@@ -1,4 +1,4 @@
 # Utility modules
 from .file_utils import FileUtils
-from .settings import Settings
-from .session_manager import SessionManager
+from .settings import Settings, get_settings
+from .session_manager import SessionManager, get_session_manager
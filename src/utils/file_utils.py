@@ -4,6 +4,7 @@ Handles file operations with encoding detection
 """
 
 import os
+import mmap
 import codecs
 from pathlib import Path
 from typing import Optional, Tuple
@@ -15,6 +16,22 @@ class FileUtils:
     # Common encodings to try
     ENCODINGS = ['utf-8', 'utf-8-sig', 'utf-16', 'latin-1', 'cp1252', 'ascii']
     
+    # Files larger than this (in bytes) are memory-mapped for reading
+    MMAP_THRESHOLD = 1024 * 1024
+    
+    # Texts longer than this (in characters) are encoded and written in slices
+    WRITE_CHUNK_CHARS = 16 * 1024 * 1024
+    
+    # Byte order marks and the encodings they identify (UTF-32 before UTF-16,
+    # since the UTF-32 LE mark starts with the UTF-16 LE one)
+    BOMS = [
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    ]
+    
     # File type to extension mapping
     FILE_TYPES = {
         'Python': ['.py', '.pyw', '.pyi'],
@@ -55,24 +72,42 @@ class FileUtils:
         if not os.path.isfile(filepath):
             return None, f"Not a file: {filepath}"
         
+        # Read the file once; encodings are tried on the bytes in memory.
+        # Large files are memory-mapped and decoded straight from the mapping,
+        # so there is never a full bytes copy next to the decoded text.
+        try:
+            with open(filepath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > cls.MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return cls._decode(mm)
+                return cls._decode(f.read())
+        except Exception as e:
+            return None, str(e)
+    
+    @classmethod
+    def _decode(cls, data) -> Tuple[str, str]:
+        """Decode bytes (or any buffer) trying the known encodings."""
+        # A byte order mark settles the encoding without trial decoding.
+        # Without one, skip the BOM-based encodings: UTF-16 would happily
+        # "decode" any even-length single-byte text into garbage.
+        head = data[:4]
+        for bom, encoding in cls.BOMS:
+            if head.startswith(bom):
+                encodings = [encoding]
+                break
+        else:
+            bom_encodings = {encoding for _, encoding in cls.BOMS}
+            encodings = [e for e in cls.ENCODINGS if e not in bom_encodings]
+        
         # Try each encoding
-        for encoding in cls.ENCODINGS:
+        for encoding in encodings:
             try:
-                with codecs.open(filepath, 'r', encoding=encoding) as f:
-                    content = f.read()
-                    return content, encoding
+                return str(data, encoding), encoding
             except (UnicodeDecodeError, UnicodeError):
                 continue
-            except Exception as e:
-                return None, str(e)
         
-        # If all encodings fail, try binary read with replacement
-        try:
-            with open(filepath, 'rb') as f:
-                content = f.read().decode('utf-8', errors='replace')
-                return content, 'utf-8 (with replacements)'
-        except Exception as e:
-            return None, str(e)
+        # If all encodings fail, decode with replacement
+        return str(data, 'utf-8', 'replace'), 'utf-8 (with replacements)'
     
     @classmethod
     def write_file(cls, filepath: str, content: str, encoding: str = 'utf-8') -> Tuple[bool, str]:
@@ -88,8 +123,18 @@ class FileUtils:
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
             
-            with codecs.open(filepath, 'w', encoding=encoding) as f:
-                f.write(content)
+            if len(content) <= cls.WRITE_CHUNK_CHARS:
+                # Encode before opening, so a failed encode leaves the file intact
+                data = content.encode(encoding)
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+            else:
+                # Encode large texts in slices instead of holding a full encoded copy
+                encoder = codecs.getincrementalencoder(encoding)()
+                with open(filepath, 'wb') as f:
+                    for start in range(0, len(content), cls.WRITE_CHUNK_CHARS):
+                        f.write(encoder.encode(content[start:start + cls.WRITE_CHUNK_CHARS]))
+                    f.write(encoder.encode('', final=True))
             
             return True, "File saved successfully"
         except Exception as e:
@@ -98,13 +143,12 @@ class FileUtils:
     @classmethod
     def get_language_from_extension(cls, filepath: str) -> str:
         """Get the language name based on file extension."""
-        ext = Path(filepath).suffix.lower()
-        
-        for language, extensions in cls.FILE_TYPES.items():
-            if ext in extensions:
-                return language
-        
-        return 'Text'
+        # Only the tail can hold a known extension, so long extensionless paths aren't scanned
+        i = filepath.rfind('.', max(0, len(filepath) - _MAX_EXT_LEN))
+        if i < 0:
+            return 'Text'
+        # A '.' in a directory name yields a "suffix" with a separator, which misses
+        return _EXT_TO_LANG.get(filepath[i:].lower(), 'Text')
     
     @classmethod
     def get_file_info(cls, filepath: str) -> dict:
@@ -139,13 +183,33 @@ class FileUtils:
     def is_binary_file(cls, filepath: str) -> bool:
         """Check if a file is likely binary."""
         try:
-            with open(filepath, 'rb') as f:
-                chunk = f.read(8192)
-                if b'\x00' in chunk:
-                    return True
-                # Check for high ratio of non-text characters
-                text_chars = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
-                non_text = len(chunk.translate(None, text_chars))
-                return non_text / len(chunk) > 0.30 if chunk else False
+            # A raw read of the sample, without a buffered file object per file
+            fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                chunk = os.read(fd, 8192)
+            finally:
+                os.close(fd)
         except Exception:
             return False
+        
+        if not chunk:
+            return False
+        if b'\x00' in chunk:
+            return True
+        # Check for high ratio of non-text characters
+        non_text = len(chunk.translate(None, _TEXT_CHARS))
+        return non_text / len(chunk) > 0.30
+
+
+# Bytes that count as text for FileUtils.is_binary_file, built once
+_TEXT_CHARS = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f}))
+
+# Extension -> language lookup table, built once from FileUtils.FILE_TYPES
+_EXT_TO_LANG = {
+    ext: language
+    for language, extensions in FileUtils.FILE_TYPES.items()
+    for ext in extensions
+}
+
+# Longest known extension, including the dot
+_MAX_EXT_LEN = max(map(len, _EXT_TO_LANG))
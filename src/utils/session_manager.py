@@ -4,15 +4,40 @@ Handles autosave and session recovery for unsaved files (like Sublime Text)
 """
 
 import os
+import sys
 import json
+import ctypes
 import uuid
+import hashlib
+import threading
+import weakref
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import QTimer, QStandardPaths
+from PySide6.QtCore import QTimer, QStandardPaths, QObject, QRunnable, QThreadPool, Signal
 
 
-class SessionManager:
+# Tab fields that change often and are logged to events.jsonl instead of
+# rewriting session.json
+_POSITION_KEYS = ('cursor_line', 'cursor_column')
+
+# Appended events after which session.json is rewritten and the log dropped
+_COMPACT_EVENTS = 256
+
+
+@lru_cache(maxsize=None)
+def _syncfs():
+    """libc syncfs(2) on Linux, or None where it isn't available."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).syncfs
+    except (OSError, AttributeError):
+        return None
+
+
+class SessionManager(QObject):
     """
     Manages session persistence including unsaved buffers.
     
@@ -20,34 +45,51 @@ class SessionManager:
     when the application is reopened.
     """
     
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self):
-        if self._initialized:
-            return
-        
-        self._initialized = True
+        super().__init__()
         self._session_dir = self._get_session_dir()
         self._buffers_dir = os.path.join(self._session_dir, 'buffers')
         self._session_file = os.path.join(self._session_dir, 'session.json')
+        self._events_file = os.path.join(self._session_dir, 'events.jsonl')
         
         # Ensure directories exist
         os.makedirs(self._buffers_dir, exist_ok=True)
         
-        # Autosave timer (every 30 seconds)
-        self._autosave_timer = QTimer()
+        # Autosave shortly after edits stop, instead of polling while idle
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(2000)  # 2 seconds
         self._autosave_timer.timeout.connect(self._autosave)
-        self._autosave_interval = 30000  # 30 seconds
+        
+        # Safety net: commit the session periodically even without edits
+        self._safety_timer = QTimer(self)
+        self._safety_timer.setInterval(300000)  # 5 minutes
+        self._safety_timer.timeout.connect(self._autosave)
+        self._autosave_enabled = False
         
         # Current session data
         self._tabs = []
         self._tab_widget = None
+        
+        # editor -> buffer id, without storing attributes on the editor widgets
+        self._buffer_ids = weakref.WeakKeyDictionary()
+        
+        # Guards buffer files, which are also read from the session loader thread
+        self._lock = threading.Lock()
+        
+        # Snapshot numbering, so a slow older write never overwrites a newer one
+        self._snapshot_generation = 0
+        self._written_generation = 0
+        
+        # What is already on disk: document revision per buffer, session.json digest
+        self._last_revisions = {}
+        self._last_session_hash = b''
+        
+        # Event log state: id tying events to the session.json they apply to,
+        # positions they were last recorded at, and how many are in the log
+        self._log_id = ''
+        self._last_positions = None
+        self._event_count = 0
     
     def _get_session_dir(self) -> str:
         """Get the session directory path."""
@@ -59,35 +101,70 @@ class SessionManager:
     def set_tab_widget(self, tab_widget):
         """Set the tab widget to monitor."""
         self._tab_widget = tab_widget
+        for i in range(tab_widget.count()):
+            self._watch_container(tab_widget.widget(i))
+        tab_widget.tabCreated.connect(self._watch_container)
+        tab_widget.tabClosed.connect(self._schedule_autosave)
+        tab_widget.currentChanged.connect(self._schedule_autosave)
+    
+    def _watch_container(self, container):
+        """Re-arm the autosave whenever the container's document changes."""
+        container.editor.document().contentsChanged.connect(self._schedule_autosave)
+    
+    def _schedule_autosave(self):
+        """Collapse a burst of changes into one save after a short delay."""
+        if self._autosave_enabled:
+            self._autosave_timer.start()
     
     def start_autosave(self):
-        """Start the autosave timer."""
-        self._autosave_timer.start(self._autosave_interval)
+        """Start the autosave timers."""
+        self._autosave_enabled = True
+        self._safety_timer.start()
     
     def stop_autosave(self):
-        """Stop the autosave timer."""
+        """Stop the autosave timers."""
+        self._autosave_enabled = False
         self._autosave_timer.stop()
+        self._safety_timer.stop()
     
     def _autosave(self):
         """Perform autosave of all tabs."""
-        self.save_session()
+        self.save_session_async()
     
     def save_session(self):
         """Save the current session including all unsaved buffers."""
+        snapshot = self.snapshot()
+        if snapshot is not None:
+            self.write_snapshot(snapshot)
+    
+    def save_session_async(self):
+        """Capture the session now and write it to disk on a worker thread."""
+        snapshot = self.snapshot()
+        if snapshot is not None:
+            QThreadPool.globalInstance().start(SessionWriter(self, snapshot))
+    
+    def snapshot(self) -> dict:
+        """
+        Capture the session from the open tabs.
+        
+        Must run on the UI thread. The result holds plain data only, so it
+        can be written out later by write_snapshot on any thread.
+        
+        Returns:
+            Dict with 'session' data and 'buffers' (buffer_id -> (revision, text))
+            holding only buffers changed since they were last written, or None
+        """
         if not self._tab_widget:
-            return
+            return None
         
         session_data = {
             'timestamp': datetime.now().isoformat(),
             'tabs': [],
             'current_tab': self._tab_widget.currentIndex(),
         }
+        buffers = {}
         
-        for i in range(self._tab_widget.count()):
-            editor = self._tab_widget.editorAt(i)
-            if not editor:
-                continue
-            
+        for i, editor in enumerate(self._tab_widget.editors()):
             tab_data = {
                 'index': i,
                 'filepath': editor.filepath,
@@ -109,34 +186,188 @@ class SessionManager:
             # If file has no path or is modified, save the buffer content
             if not editor.filepath or editor.isModified():
                 buffer_id = self._get_buffer_id(editor)
+                revision = editor.document().revision()
+                # Unchanged since the last successful write, the file is current
+                if self._last_revisions.get(buffer_id) != revision:
+                    buffers[buffer_id] = (revision, editor.text())
+                tab_data['buffer_id'] = buffer_id
+            
+            # Save tab title for untitled files
+            if not editor.filepath:
+                tab_data['title'] = self._tab_widget.tabTitle(i)
+            
+            session_data['tabs'].append(tab_data)
+        
+        self._snapshot_generation += 1
+        return {
+            'session': session_data,
+            'buffers': buffers,
+            'generation': self._snapshot_generation,
+        }
+    
+    def write_snapshot(self, snapshot: dict):
+        """Write a captured session to disk. Safe to call from a worker thread."""
+        session_data = snapshot['session']
+        failed = set()
+        written = []  # paths written by this save, for the durability barrier
+        
+        with self._lock:
+            if snapshot['generation'] < self._written_generation:
+                return
+            self._written_generation = snapshot['generation']
+            
+            for buffer_id, (revision, content) in snapshot['buffers'].items():
                 buffer_file = os.path.join(self._buffers_dir, f'{buffer_id}.txt')
-                
                 try:
-                    content = editor.text()
-                    with open(buffer_file, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    tab_data['buffer_id'] = buffer_id
+                    self._write_atomic(buffer_file, content.encode('utf-8'))
+                    self._last_revisions[buffer_id] = revision
+                    written.append(buffer_file)
                 except Exception as e:
+                    failed.add(buffer_id)
                     print(f"Error saving buffer: {e}")
             
-            # Save tab title for untitled files
-            if not editor.filepath:
-                tab_data['title'] = self._tab_widget.tabText(i).rstrip('*')
+            # Don't point the session at buffers that weren't written
+            if failed:
+                for tab_data in session_data['tabs']:
+                    if tab_data.get('buffer_id') in failed:
+                        del tab_data['buffer_id']
             
-            session_data['tabs'].append(tab_data)
+            # session.json holds the tab list; cursor moves and tab switches on
+            # an unchanged tab list are appended to events.jsonl instead
+            tabs = session_data['tabs']
+            skeleton = [
+                {k: v for k, v in tab_data.items() if k not in _POSITION_KEYS}
+                for tab_data in tabs
+            ]
+            session_hash = hashlib.blake2b(
+                json.dumps(skeleton, sort_keys=True).encode('utf-8')
+            ).digest()
+            positions = (
+                [(tab_data['cursor_line'], tab_data['cursor_column']) for tab_data in tabs],
+                session_data['current_tab'],
+            )
+            
+            try:
+                if (session_hash != self._last_session_hash
+                        or self._event_count >= _COMPACT_EVENTS):
+                    self._write_session_file(session_data)
+                    self._last_session_hash = session_hash
+                    written.append(self._session_file)
+                elif self._append_events(positions):
+                    written.append(self._events_file)
+                self._last_positions = positions
+            except Exception as e:
+                print(f"Error saving session: {e}")
+            
+            # One durability barrier for the whole save instead of an fsync per file
+            if written:
+                self._sync_to_disk(written)
+    
+    def _write_session_file(self, session_data: dict):
+        """Rewrite session.json in full and start a new, empty event log."""
+        self._log_id = uuid.uuid4().hex[:8]
+        session_data = dict(session_data, log_id=self._log_id)
+        payload = json.dumps(session_data, separators=(',', ':')).encode('utf-8')
+        self._write_atomic(self._session_file, payload)
         
-        # Write session file
+        # Events left from the previous log carry its id and are ignored on load
         try:
-            with open(self._session_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving session: {e}")
+            os.remove(self._events_file)
+        except FileNotFoundError:
+            pass
+        self._event_count = 0
+    
+    def _append_events(self, positions: tuple) -> bool:
+        """Append the cursor and current tab changes since the last save."""
+        cursors, current = positions
+        last_cursors, last_current = self._last_positions
+        
+        events = [
+            {'l': self._log_id, 'i': i, 'line': line, 'col': col}
+            for i, (line, col) in enumerate(cursors)
+            if (line, col) != last_cursors[i]
+        ]
+        if current != last_current:
+            events.append({'l': self._log_id, 'current': current})
+        if not events:
+            return False
+        
+        payload = ''.join(
+            json.dumps(event, separators=(',', ':')) + '\n' for event in events
+        ).encode('utf-8')
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0)
+        fd = os.open(self._events_file, flags, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        
+        self._event_count += len(events)
+        return True
+    
+    def _sync_to_disk(self, paths: list):
+        """Flush the files written by this save, and their renames, to stable storage."""
+        try:
+            if os.name != 'nt':
+                dfd = os.open(self._session_dir, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    # syncfs commits the buffer files, session.json and the renames at once
+                    syncfs = _syncfs()
+                    if syncfs is not None and syncfs(dfd) == 0:
+                        return
+                finally:
+                    os.close(dfd)
+            
+            # Otherwise flush each written file, then each directory holding a rename
+            for path in paths:
+                fd = os.open(path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            
+            # Windows has no directory handles; its renames are journaled by NTFS
+            if os.name != 'nt':
+                directories = {os.path.dirname(path) for path in paths}
+                directories.add(self._session_dir)  # the events file may have been removed
+                for directory in directories:
+                    dfd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                    try:
+                        os.fsync(dfd)
+                    finally:
+                        os.close(dfd)
+        except OSError as e:
+            print(f"Error syncing session: {e}")
+    
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        """Write a file via a temporary file and rename, so it is never left half-written."""
+        tmp_path = path + '.tmp'
+        # Unbuffered write of the already-encoded bytes, no file object copy
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
     
     def _get_buffer_id(self, editor) -> str:
         """Get or create a unique buffer ID for an editor."""
-        if not hasattr(editor, '_buffer_id') or not editor._buffer_id:
-            editor._buffer_id = str(uuid.uuid4())[:8]
-        return editor._buffer_id
+        buffer_id = self._buffer_ids.get(editor)
+        if not buffer_id:
+            buffer_id = self._buffer_ids[editor] = str(uuid.uuid4())[:8]
+        return buffer_id
+    
+    def set_buffer_id(self, editor, buffer_id: str):
+        """Assign a restored buffer ID to an editor."""
+        self._buffer_ids[editor] = buffer_id
+        # Revisions recorded for an earlier editor don't apply to this document
+        self._last_revisions.pop(buffer_id, None)
     
     def load_session(self) -> tuple:
         """
@@ -149,24 +380,55 @@ class SessionManager:
             return [], 0
         
         try:
-            with open(self._session_file, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            with open(self._session_file, 'rb') as f:
+                session_data = json.loads(f.read())
             
-            return session_data.get('tabs', []), session_data.get('current_tab', 0)
+            tabs = session_data.get('tabs', [])
+            current_tab = session_data.get('current_tab', 0)
+            log_id = session_data.get('log_id')
+            if log_id:
+                current_tab = self._replay_events(log_id, tabs, current_tab)
+            return tabs, current_tab
         except Exception as e:
             print(f"Error loading session: {e}")
             return [], 0
     
+    def _replay_events(self, log_id: str, tabs: list, current_tab: int) -> int:
+        """Apply logged cursor moves and tab switches to the loaded tabs."""
+        try:
+            with open(self._events_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return current_tab
+        
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                # A torn last line from an interrupted append
+                continue
+            if event.get('l') != log_id:
+                continue
+            
+            if 'current' in event:
+                current_tab = event['current']
+            elif 0 <= event.get('i', -1) < len(tabs):
+                tab_data = tabs[event['i']]
+                tab_data['cursor_line'] = event.get('line', 1)
+                tab_data['cursor_column'] = event.get('col', 1)
+        return current_tab
+    
     def get_buffer_content(self, buffer_id: str) -> str:
         """Get the content of a saved buffer."""
         buffer_file = os.path.join(self._buffers_dir, f'{buffer_id}.txt')
         
-        if os.path.exists(buffer_file):
-            try:
-                with open(buffer_file, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except Exception as e:
-                print(f"Error reading buffer: {e}")
+        with self._lock:
+            if os.path.exists(buffer_file):
+                try:
+                    with open(buffer_file, 'r', encoding='utf-8') as f:
+                        return f.read()
+                except Exception as e:
+                    print(f"Error reading buffer: {e}")
         
         return ""
     
@@ -175,27 +437,135 @@ class SessionManager:
         if not os.path.exists(self._buffers_dir):
             return
         
-        for filename in os.listdir(self._buffers_dir):
-            buffer_id = filename.replace('.txt', '')
-            if buffer_id not in keep_ids:
-                try:
-                    os.remove(os.path.join(self._buffers_dir, filename))
-                except:
-                    pass
+        keep = set(keep_ids)
+        with os.scandir(self._buffers_dir) as entries:
+            for entry in entries:
+                # Anything that isn't a kept buffer goes, including stray .tmp files
+                name = entry.name
+                buffer_id = name[:-4] if name.endswith('.txt') else name
+                if buffer_id not in keep:
+                    self._last_revisions.pop(buffer_id, None)
+                    try:
+                        os.unlink(entry.path)
+                    except:
+                        pass
     
     def clear_session(self):
         """Clear all session data."""
-        # Remove session file
-        if os.path.exists(self._session_file):
-            try:
-                os.remove(self._session_file)
-            except:
-                pass
+        self._last_revisions.clear()
+        self._last_session_hash = b''
+        self._last_positions = None
+        self._event_count = 0
         
-        # Remove all buffer files
-        if os.path.exists(self._buffers_dir):
-            for filename in os.listdir(self._buffers_dir):
+        # Remove session file and its event log
+        for path in (self._session_file, self._events_file):
+            if os.path.exists(path):
                 try:
-                    os.remove(os.path.join(self._buffers_dir, filename))
+                    os.remove(path)
                 except:
                     pass
+        
+        # Remove all buffer files
+        if os.path.exists(self._buffers_dir):
+            with os.scandir(self._buffers_dir) as entries:
+                for entry in entries:
+                    try:
+                        os.unlink(entry.path)
+                    except:
+                        pass
+
+
+@lru_cache(maxsize=None)
+def get_session_manager() -> SessionManager:
+    """
+    Get the shared session manager.
+    
+    Created on first use rather than at import, since the session directory
+    depends on the application name being set.
+    """
+    return SessionManager()
+
+
+class SessionWriter(QRunnable):
+    """Worker that writes a session snapshot to disk off the UI thread."""
+    
+    def __init__(self, session_manager: SessionManager, snapshot: dict):
+        super().__init__()
+        self._session_manager = session_manager
+        self._snapshot = snapshot
+    
+    def run(self):
+        """Write the snapshot."""
+        self._session_manager.write_snapshot(self._snapshot)
+
+
+class SessionLoaderSignals(QObject):
+    """Signals emitted by SessionLoader (QRunnable can't define signals itself)."""
+    
+    tabReady = Signal(dict, str)  # tab data, restored buffer content
+    finished = Signal(int)  # current tab index
+
+
+class SessionLoader(QRunnable):
+    """
+    Worker that does the disk I/O of session restore off the UI thread.
+    
+    Checks which files still exist and reads saved buffers, then hands each
+    tab to the UI thread through tabReady, in session order.
+    """
+    
+    def __init__(self, session_manager: SessionManager, tabs_data: list, current_tab: int):
+        super().__init__()
+        self.signals = SessionLoaderSignals()
+        self._session_manager = session_manager
+        self._tabs_data = tabs_data
+        self._current_tab = current_tab
+    
+    def run(self):
+        """Prepare every tab and emit it."""
+        dir_entries = self._scan_directories(
+            tab_data.get('filepath') for tab_data in self._tabs_data
+        )
+        
+        for tab_data in self._tabs_data:
+            tab_data = dict(tab_data)
+            filepath = tab_data.get('filepath')
+            tab_data['exists'] = bool(filepath) and self._file_exists(filepath, dir_entries)
+            
+            content = ""
+            buffer_id = tab_data.get('buffer_id')
+            # Buffers are only restored for modified files and untitled tabs
+            if buffer_id and (not tab_data['exists'] or tab_data.get('modified')):
+                content = self._session_manager.get_buffer_content(buffer_id)
+            
+            self.signals.tabReady.emit(tab_data, content)
+        
+        self.signals.finished.emit(self._current_tab)
+    
+    @staticmethod
+    def _scan_directories(filepaths) -> dict:
+        """List each parent directory once instead of stat-ing every file."""
+        dir_entries = {}
+        for filepath in filepaths:
+            if not filepath:
+                continue
+            
+            dirname = os.path.dirname(filepath)
+            if dirname in dir_entries:
+                continue
+            
+            try:
+                with os.scandir(dirname or '.') as entries:
+                    dir_entries[dirname] = {entry.name for entry in entries}
+            except OSError:
+                dir_entries[dirname] = set()
+        return dir_entries
+    
+    @staticmethod
+    def _file_exists(filepath: str, dir_entries: dict) -> bool:
+        """Check a path against the scanned directories."""
+        names = dir_entries.get(os.path.dirname(filepath), ())
+        if os.path.basename(filepath) in names:
+            return True
+        # Differently-cased paths on case-insensitive filesystems miss the listing
+        return os.path.exists(filepath)
@@ -3,10 +3,48 @@ SuperSupText - Settings Manager
 Handles application settings persistence using QSettings
 """
 
-from PySide6.QtCore import QSettings, QSize, QPoint
+from PySide6.QtCore import QSettings, QSize, QPoint, QObject, Signal
 from PySide6.QtGui import QFont
 import json
 import os
+import time
+from functools import lru_cache
+
+
+# Cache markers: key not looked up yet / key not stored in QSettings
+_UNCACHED = object()
+_MISSING = object()
+
+# How long the recent-files existence check stays valid, in seconds
+_RECENT_TTL = 5.0
+
+
+def _to_bool(value, default):
+    """Coerce a stored value to bool (INI backends store 'true'/'false')."""
+    if isinstance(value, str):
+        return value.lower() == 'true'
+    return bool(value)
+
+
+def _to_int(value, default):
+    """Coerce a stored value to int, falling back to the default."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+# Coercion by the type of a setting's default value
+_CONVERTERS = {
+    bool: _to_bool,
+    int: _to_int,
+}
+
+
+class SettingsNotifier(QObject):
+    """Carries the change signal for Settings, which isn't a QObject itself."""
+    
+    valueChanged = Signal(str, object)  # key, new value
 
 
 class Settings:
@@ -38,38 +76,55 @@ class Settings:
         'files/session': [],
     }
     
-    _instance = None
+    def __init__(self):
+        self._settings = QSettings('SuperSupText', 'SuperSupText')
+        self._notifier = SettingsNotifier()
+        # key -> stored value (or _MISSING), kept in step by set/update
+        self._cache = {}
+        # (stored recent list, check time, existing files) for get_recent_files
+        self._recent_cache = None
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._settings = QSettings('SuperSupText', 'SuperSupText')
-        return cls._instance
+    @property
+    def valueChanged(self):
+        """Signal emitted with (key, value) whenever a setting is written."""
+        return self._notifier.valueChanged
     
     def get(self, key, default=None):
         """Get a setting value."""
         if default is None:
             default = self.DEFAULTS.get(key)
-        value = self._settings.value(key, default)
         
-        # Handle type conversion for boolean values
-        if isinstance(default, bool):
-            if isinstance(value, str):
-                return value.lower() == 'true'
-            return bool(value)
+        value = self._cache.get(key, _UNCACHED)
+        if value is _UNCACHED:
+            value = self._settings.value(key) if self._settings.contains(key) else _MISSING
+            self._cache[key] = value
         
-        # Handle type conversion for integer values
-        if isinstance(default, int) and not isinstance(default, bool):
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return default
+        if value is _MISSING:
+            return default
         
-        return value
+        # Handle type conversion for boolean and integer values
+        convert = _CONVERTERS.get(type(default))
+        return convert(value, default) if convert else value
+    
+    def get_many(self, keys) -> dict:
+        """Get several setting values at once, keyed by setting name."""
+        return {key: self.get(key) for key in keys}
     
     def set(self, key, value):
         """Set a setting value."""
         self._settings.setValue(key, value)
+        self._cache[key] = value
+        self._notifier.valueChanged.emit(key, value)
+    
+    def update(self, mapping: dict):
+        """Set several setting values and write them out together."""
+        for key, value in mapping.items():
+            self._settings.setValue(key, value)
+            self._cache[key] = value
+        self._settings.sync()
+        
+        for key, value in mapping.items():
+            self._notifier.valueChanged.emit(key, value)
     
     def get_font(self):
         """Get the editor font."""
@@ -91,9 +146,8 @@ class Settings:
         if not isinstance(recent, list):
             recent = []
         
-        # Remove if already exists
-        if filepath in recent:
-            recent.remove(filepath)
+        # Remove if already exists (building a new list, the old one is cached)
+        recent = [f for f in recent if f != filepath]
         
         # Add to beginning
         recent.insert(0, filepath)
@@ -109,8 +163,17 @@ class Settings:
         recent = self.get('files/recent', [])
         if not isinstance(recent, list):
             return []
+        
+        # Reuse a recent existence check while the stored list is unchanged
+        now = time.monotonic()
+        cached = self._recent_cache
+        if cached is not None and cached[0] is recent and now - cached[1] < _RECENT_TTL:
+            return list(cached[2])
+        
         # Filter out files that no longer exist
-        return [f for f in recent if os.path.exists(f)]
+        existing = [f for f in recent if os.path.exists(f)]
+        self._recent_cache = (recent, now, existing)
+        return list(existing)
     
     def clear_recent_files(self):
         """Clear recent files list."""
@@ -130,3 +193,9 @@ class Settings:
     def sync(self):
         """Force sync settings to disk."""
         self._settings.sync()
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Get the shared application settings."""
+    return Settings()
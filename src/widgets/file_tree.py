@@ -4,15 +4,58 @@ File explorer sidebar with tree view navigation
 """
 
 import os
+import shutil
+import ctypes
+from functools import lru_cache
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeView, QFileSystemModel,
     QLineEdit, QPushButton, QMenu, QInputDialog, QMessageBox,
     QHeaderView, QAbstractItemView
 )
-from PySide6.QtCore import Signal, Qt, QDir, QModelIndex
+from PySide6.QtCore import (
+    Signal, Qt, QDir, QModelIndex, QTimer, QObject, QRunnable, QThreadPool
+)
 from PySide6.QtGui import QAction, QIcon
 
-from ..utils.settings import Settings
+from ..utils.settings import get_settings
+
+
+@lru_cache(maxsize=None)
+def _shell32():
+    """Load and prototype the shell32 reveal functions once (Windows only)."""
+    from ctypes import wintypes
+    
+    shell32 = ctypes.windll.shell32
+    # COM may already be initialized by Qt on this thread; that is fine
+    ctypes.windll.ole32.CoInitialize(None)
+    
+    shell32.SHParseDisplayName.argtypes = [
+        wintypes.LPCWSTR, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p),
+        wintypes.ULONG, ctypes.POINTER(wintypes.ULONG),
+    ]
+    shell32.SHParseDisplayName.restype = ctypes.HRESULT
+    shell32.SHOpenFolderAndSelectItems.argtypes = [
+        ctypes.c_void_p, wintypes.UINT, ctypes.c_void_p, wintypes.DWORD,
+    ]
+    shell32.SHOpenFolderAndSelectItems.restype = ctypes.HRESULT
+    shell32.ILFree.argtypes = [ctypes.c_void_p]
+    shell32.ILFree.restype = None
+    return shell32
+
+
+def _reveal_windows(filepath: str) -> bool:
+    """Select a file in Explorer in-process. Returns False if the shell call failed."""
+    try:
+        shell32 = _shell32()
+        pidl = ctypes.c_void_p()
+        shell32.SHParseDisplayName(os.path.normpath(filepath), None, ctypes.byref(pidl), 0, None)
+        try:
+            shell32.SHOpenFolderAndSelectItems(pidl, 0, None, 0)
+        finally:
+            shell32.ILFree(pidl)
+        return True
+    except (OSError, AttributeError):
+        return False
 
 
 class FileTree(QWidget):
@@ -34,10 +77,22 @@ class FileTree(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.settings = Settings()
+        self.settings = get_settings()
         self._root_path = None
         
+        # Deletions running on the thread pool, kept alive until they report back
+        self._delete_tasks = set()
+        
+        # Filter is applied once typing pauses, not on every keystroke
+        self._pending_filter = ""
+        self._applied_filter = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        
         self._setup_ui()
+        self._setup_context_menu()
         self._setup_model()
         self._connect_signals()
         self._apply_style()
@@ -88,13 +143,51 @@ class FileTree(QWidget):
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         layout.addWidget(self.tree)
     
+    def _setup_context_menu(self):
+        """Create the context menu once; each invocation only retargets it."""
+        self._menu_target = None
+        self._menu = QMenu(self)
+        
+        self._act_open = self._menu.addAction("Open")
+        self._act_open.triggered.connect(self._menu_open)
+        self._sep_open = self._menu.addSeparator()
+        
+        self._act_new_file = self._menu.addAction("New File")
+        self._act_new_file.triggered.connect(self._menu_new_file)
+        self._act_new_folder = self._menu.addAction("New Folder")
+        self._act_new_folder.triggered.connect(self._menu_new_folder)
+        self._sep_new = self._menu.addSeparator()
+        
+        self._act_rename = self._menu.addAction("Rename")
+        self._act_rename.triggered.connect(self._menu_rename)
+        self._act_delete = self._menu.addAction("Delete")
+        self._act_delete.triggered.connect(self._menu_delete)
+        self._sep_edit = self._menu.addSeparator()
+        
+        self._act_copy_path = self._menu.addAction("Copy Path")
+        self._act_copy_path.triggered.connect(self._menu_copy_path)
+        self._act_reveal = self._menu.addAction("Reveal in Explorer")
+        self._act_reveal.triggered.connect(self._menu_reveal)
+        
+        # Actions shown only for an item, as opposed to the empty area
+        self._item_actions = (
+            self._sep_new, self._act_rename, self._act_delete, self._sep_edit,
+            self._act_copy_path, self._act_reveal,
+        )
+    
     def _on_collapse_clicked(self):
         """Handle collapse button click."""
         self.hideRequested.emit()
     
     def _setup_model(self):
         """Setup the file system model."""
-        self.model = QFileSystemModel()
+        self.model = QFileSystemModel(self)
+        # Skip per-directory icon lookups and symlink resolution for every
+        # listed entry; children are still only fetched for expanded folders
+        self.model.setOptions(
+            QFileSystemModel.Option.DontUseCustomDirectoryIcons
+            | QFileSystemModel.Option.DontResolveSymlinks
+        )
         self.model.setRootPath("")
         
         # Show only these file types (all by default)
@@ -203,6 +296,15 @@ class FileTree(QWidget):
     
     def _on_filter_changed(self, text: str):
         """Handle filter text change."""
+        self._pending_filter = text
+        self._filter_timer.start()
+    
+    def _apply_filter(self):
+        """Apply the pending filter to the model."""
+        text = self._pending_filter
+        if text == self._applied_filter:
+            return
+        self._applied_filter = text
         if text:
             self.model.setNameFilters([f"*{text}*"])
         else:
@@ -219,49 +321,57 @@ class FileTree(QWidget):
         """Show context menu."""
         index = self.tree.indexAt(position)
         
-        menu = QMenu(self)
-        
         if index.isValid():
             filepath = self.model.filePath(index)
             is_dir = os.path.isdir(filepath)
-            
-            if not is_dir:
-                open_action = menu.addAction("Open")
-                open_action.triggered.connect(lambda: self.fileDoubleClicked.emit(filepath))
-                menu.addSeparator()
-            
-            if is_dir:
-                new_file_action = menu.addAction("New File")
-                new_file_action.triggered.connect(lambda: self._new_file(filepath))
-                
-                new_folder_action = menu.addAction("New Folder")
-                new_folder_action.triggered.connect(lambda: self._new_folder(filepath))
-                menu.addSeparator()
-            
-            rename_action = menu.addAction("Rename")
-            rename_action.triggered.connect(lambda: self._rename(filepath))
-            
-            delete_action = menu.addAction("Delete")
-            delete_action.triggered.connect(lambda: self._delete(filepath))
-            
-            menu.addSeparator()
-            
-            copy_path_action = menu.addAction("Copy Path")
-            copy_path_action.triggered.connect(lambda: self._copy_path(filepath))
-            
-            reveal_action = menu.addAction("Reveal in Explorer")
-            reveal_action.triggered.connect(lambda: self._reveal_in_explorer(filepath))
-        else:
+            on_item = True
+        elif self._root_path:
             # Clicked on empty area
-            if self._root_path:
-                new_file_action = menu.addAction("New File")
-                new_file_action.triggered.connect(lambda: self._new_file(self._root_path))
-                
-                new_folder_action = menu.addAction("New Folder")
-                new_folder_action.triggered.connect(lambda: self._new_folder(self._root_path))
+            filepath = self._root_path
+            is_dir = True
+            on_item = False
+        else:
+            return
+        
+        self._menu_target = filepath
+        self._act_open.setVisible(not is_dir)
+        self._sep_open.setVisible(not is_dir)
+        self._act_new_file.setVisible(is_dir)
+        self._act_new_folder.setVisible(is_dir)
+        for action in self._item_actions:
+            action.setVisible(on_item)
+        # No separator directly after New Folder when nothing follows it
+        self._sep_new.setVisible(on_item and is_dir)
         
-        if menu.actions():
-            menu.exec_(self.tree.mapToGlobal(position))
+        self._menu.exec_(self.tree.mapToGlobal(position))
+    
+    def _menu_open(self):
+        """Open the targeted file."""
+        self.fileDoubleClicked.emit(self._menu_target)
+    
+    def _menu_new_file(self):
+        """Create a file in the targeted folder."""
+        self._new_file(self._menu_target)
+    
+    def _menu_new_folder(self):
+        """Create a folder in the targeted folder."""
+        self._new_folder(self._menu_target)
+    
+    def _menu_rename(self):
+        """Rename the targeted item."""
+        self._rename(self._menu_target)
+    
+    def _menu_delete(self):
+        """Delete the targeted item."""
+        self._delete(self._menu_target)
+    
+    def _menu_copy_path(self):
+        """Copy the targeted path."""
+        self._copy_path(self._menu_target)
+    
+    def _menu_reveal(self):
+        """Reveal the targeted item."""
+        self._reveal_in_explorer(self._menu_target)
     
     def _new_file(self, parent_dir: str):
         """Create a new file."""
@@ -315,14 +425,16 @@ class FileTree(QWidget):
         )
         
         if result == QMessageBox.StandardButton.Yes:
-            try:
-                if os.path.isfile(filepath):
-                    os.remove(filepath)
-                else:
-                    import shutil
-                    shutil.rmtree(filepath)
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Could not delete:\n{e}")
+            task = DeleteTask(filepath)
+            task.signals.finished.connect(self._on_delete_finished)
+            self._delete_tasks.add(task)
+            QThreadPool.globalInstance().start(task)
+    
+    def _on_delete_finished(self, filepath: str, error: str):
+        """Report the result of a background deletion."""
+        self._delete_tasks = {t for t in self._delete_tasks if t.filepath != filepath}
+        if error:
+            QMessageBox.warning(self, "Error", f"Could not delete:\n{error}")
     
     def _copy_path(self, filepath: str):
         """Copy path to clipboard."""
@@ -335,9 +447,10 @@ class FileTree(QWidget):
         
         if os.name == 'nt':  # Windows
             if os.path.isfile(filepath):
-                subprocess.run(['explorer', '/select,', filepath])
+                if not _reveal_windows(filepath):
+                    subprocess.run(['explorer', '/select,', filepath])
             else:
-                subprocess.run(['explorer', filepath])
+                os.startfile(filepath)
         elif os.name == 'posix':  # Linux/Mac
             subprocess.run(['xdg-open', os.path.dirname(filepath)])
     
@@ -375,3 +488,32 @@ class FileTree(QWidget):
             """)
         else:
             self._apply_style()
+
+
+class DeleteTaskSignals(QObject):
+    """Signals emitted by DeleteTask (QRunnable can't define signals itself)."""
+    
+    finished = Signal(str, str)  # filepath, error message ('' on success)
+
+
+class DeleteTask(QRunnable):
+    """Worker that deletes a file or folder tree off the UI thread."""
+    
+    def __init__(self, filepath: str):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = DeleteTaskSignals()
+        self.filepath = filepath
+    
+    def run(self):
+        """Delete the path and report back."""
+        error = ""
+        try:
+            if os.path.isdir(self.filepath) and not os.path.islink(self.filepath):
+                # rmtree walks with dir fds and never follows symlinks
+                shutil.rmtree(self.filepath)
+            else:
+                os.remove(self.filepath)
+        except Exception as e:
+            error = str(e)
+        self.signals.finished.emit(self.filepath, error)
@@ -3,14 +3,165 @@ SuperSupText - Search Widget
 Search and replace functionality with regex support
 """
 
+import re
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
     QLabel, QCheckBox, QFrame, QSizePolicy
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import (
+    Signal, Qt, QTimer, QObject, QRunnable, QThreadPool, QRegularExpression
+)
 from PySide6.QtGui import QKeySequence, QShortcut
 
 
+_DARK_QSS = """
+    QWidget {
+        background-color: #252526;
+        color: #cccccc;
+    }
+    #findInput, #replaceInput {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        border: 1px solid #3c3c3c;
+        padding: 6px 10px;
+        border-radius: 3px;
+        font-size: 13px;
+    }
+    #findInput:focus, #replaceInput:focus {
+        border-color: #0e639c;
+    }
+    #matchLabel {
+        color: #888888;
+        font-size: 12px;
+    }
+    #navBtn, #closeBtn {
+        background-color: transparent;
+        color: #cccccc;
+        border: none;
+        border-radius: 3px;
+        font-size: 12px;
+    }
+    #navBtn:hover, #closeBtn:hover {
+        background-color: #3c3c3c;
+    }
+    #actionBtn {
+        background-color: #0e639c;
+        color: white;
+        border: none;
+        padding: 6px 12px;
+        border-radius: 3px;
+    }
+    #actionBtn:hover {
+        background-color: #1177bb;
+    }
+    #optionCheck {
+        color: #cccccc;
+        spacing: 4px;
+    }
+    #optionCheck::indicator {
+        width: 14px;
+        height: 14px;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        background-color: #3c3c3c;
+    }
+    #optionCheck::indicator:checked {
+        background-color: #0e639c;
+        border-color: #0e639c;
+    }
+    #toggleBtn {
+        background-color: transparent;
+        color: #888888;
+        border: none;
+        padding: 4px 8px;
+    }
+    #toggleBtn:hover {
+        color: #cccccc;
+    }
+"""
+
+_LIGHT_QSS = """
+    QWidget {
+        background-color: #f3f3f3;
+        color: #333333;
+    }
+    #findInput, #replaceInput {
+        background-color: #ffffff;
+        color: #333333;
+        border: 1px solid #e0e0e0;
+        padding: 6px 10px;
+        border-radius: 3px;
+    }
+    #findInput:focus, #replaceInput:focus {
+        border-color: #0e639c;
+    }
+    #matchLabel {
+        color: #666666;
+    }
+    #navBtn, #closeBtn {
+        background-color: transparent;
+        color: #333333;
+        border: none;
+        border-radius: 3px;
+    }
+    #navBtn:hover, #closeBtn:hover {
+        background-color: #e0e0e0;
+    }
+    #actionBtn {
+        background-color: #0e639c;
+        color: white;
+        border: none;
+        padding: 6px 12px;
+        border-radius: 3px;
+    }
+    #optionCheck {
+        color: #333333;
+    }
+    #toggleBtn {
+        background-color: transparent;
+        color: #666666;
+        border: none;
+    }
+"""
+
+# Keys handled by SearchWidget.keyPressEvent
+_KEY_ESCAPE = Qt.Key.Key_Escape
+_KEY_F3 = Qt.Key.Key_F3
+_MOD_SHIFT = Qt.KeyboardModifier.ShiftModifier
+
+# Regex matches are counted up to this many, then shown as "N+"
+_MATCH_COUNT_CAP = 10000
+
+# Documents larger than twice this are only counted this far around the viewport
+_COUNT_WINDOW_CHARS = 1_000_000
+
+
+@lru_cache(maxsize=64)
+def _build_pattern(text: str, case: bool, word: bool, regex: bool):
+    """
+    Compile the pattern for a search once per (text, options).
+    
+    Uses QRegularExpression (PCRE2, JIT-compiled by optimize()), the same
+    engine the editor's find uses, so counts agree with navigation.
+    Returns None for an invalid regex.
+    """
+    pattern = text if regex else re.escape(text)
+    if word:
+        pattern = rf'\b(?:{pattern})\b'
+    # Unicode properties make \b and \w see letters like 'ế' as word characters,
+    # as FindWholeWords does in navigation
+    options = QRegularExpression.PatternOption.UseUnicodePropertiesOption
+    if not case:
+        options |= QRegularExpression.PatternOption.CaseInsensitiveOption
+    qregex = QRegularExpression(pattern, options)
+    if not qregex.isValid():
+        return None
+    qregex.optimize()
+    return qregex
+
+
 class SearchWidget(QWidget):
     """
     Search and Replace widget.
@@ -37,6 +188,21 @@ class SearchWidget(QWidget):
         self._match_count = 0
         self._current_match = 0
         
+        # Editor text (and its lowercase copy), reused while the revision holds
+        self._content_revision = -1
+        self._content = ""
+        self._content_lower = None
+        
+        # Match counts run on the thread pool; only the latest generation is shown
+        self._count_generation = 0
+        self._count_tasks = set()
+        
+        # Search once typing pauses instead of scanning the buffer per keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(120)
+        self._search_timer.timeout.connect(self._find_next)
+        
         self._setup_ui()
         self._connect_signals()
         self._apply_style()
@@ -145,84 +311,35 @@ class SearchWidget(QWidget):
         self.show_replace_btn.toggled.connect(self._toggle_replace)
         
         # Options trigger new search
-        self.case_check.toggled.connect(lambda: self._find_next())
-        self.word_check.toggled.connect(lambda: self._find_next())
-        self.regex_check.toggled.connect(lambda: self._find_next())
+        self.case_check.toggled.connect(self._on_option_changed)
+        self.word_check.toggled.connect(self._on_option_changed)
+        self.regex_check.toggled.connect(self._on_option_changed)
     
     def _apply_style(self):
         """Apply styling."""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #252526;
-                color: #cccccc;
-            }
-            #findInput, #replaceInput {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #3c3c3c;
-                padding: 6px 10px;
-                border-radius: 3px;
-                font-size: 13px;
-            }
-            #findInput:focus, #replaceInput:focus {
-                border-color: #0e639c;
-            }
-            #matchLabel {
-                color: #888888;
-                font-size: 12px;
-            }
-            #navBtn, #closeBtn {
-                background-color: transparent;
-                color: #cccccc;
-                border: none;
-                border-radius: 3px;
-                font-size: 12px;
-            }
-            #navBtn:hover, #closeBtn:hover {
-                background-color: #3c3c3c;
-            }
-            #actionBtn {
-                background-color: #0e639c;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 3px;
-            }
-            #actionBtn:hover {
-                background-color: #1177bb;
-            }
-            #optionCheck {
-                color: #cccccc;
-                spacing: 4px;
-            }
-            #optionCheck::indicator {
-                width: 14px;
-                height: 14px;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                background-color: #3c3c3c;
-            }
-            #optionCheck::indicator:checked {
-                background-color: #0e639c;
-                border-color: #0e639c;
-            }
-            #toggleBtn {
-                background-color: transparent;
-                color: #888888;
-                border: none;
-                padding: 4px 8px;
-            }
-            #toggleBtn:hover {
-                color: #cccccc;
-            }
-        """)
+        self._theme = 'dark'
+        self.setStyleSheet(_DARK_QSS)
     
     def setEditor(self, editor):
         """Set the editor to search in."""
+        if editor is not self._editor:
+            self._content_revision = -1
+            self._content = ""
+            self._content_lower = None
         self._editor = editor
     
+    def _editor_content(self) -> str:
+        """Get the editor text, fetching it again only after an edit."""
+        revision = self._editor.revision()
+        if revision != self._content_revision:
+            self._content_revision = revision
+            self._content = self._editor.text()
+            self._content_lower = None
+        return self._content
+    
     def showFind(self):
         """Show the find panel."""
+        self.find_input.blockSignals(False)
         self.setVisible(True)
         self.replace_row.setVisible(False)
         self.show_replace_btn.setChecked(False)
@@ -238,6 +355,7 @@ class SearchWidget(QWidget):
     
     def showReplace(self):
         """Show the find and replace panel."""
+        self.find_input.blockSignals(False)
         self.setVisible(True)
         self.replace_row.setVisible(True)
         self.show_replace_btn.setChecked(True)
@@ -261,6 +379,9 @@ class SearchWidget(QWidget):
     
     def _close(self):
         """Close the search panel."""
+        self._search_timer.stop()
+        # No find-as-you-type while closed; showFind/showReplace re-enable it
+        self.find_input.blockSignals(True)
         self.setVisible(False)
         self.closeRequested.emit()
         if self._editor:
@@ -269,35 +390,45 @@ class SearchWidget(QWidget):
     def _on_find_text_changed(self, text: str):
         """Handle find text change."""
         if text:
-            self._find_next()
+            self._search_timer.start()
         else:
+            self._search_timer.stop()
+            self._count_generation += 1
             self.match_label.setText("")
             self._match_count = 0
             self._current_match = 0
     
+    def _opts(self) -> tuple:
+        """Read the (case, word, regex) options once."""
+        return (
+            self.case_check.isChecked(),
+            self.word_check.isChecked(),
+            self.regex_check.isChecked(),
+        )
+    
+    def _on_option_changed(self, checked: bool):
+        """Re-run the search (debounced) when a search option is toggled."""
+        if self.find_input.text():
+            self._search_timer.start()
+    
     def _find_next(self):
         """Find next occurrence."""
         text = self.find_input.text()
         if not text or not self._editor:
             return
         
+        case, word, regex = self._opts()
         found = self._editor.find(
             text,
-            case_sensitive=self.case_check.isChecked(),
-            whole_word=self.word_check.isChecked(),
-            regex=self.regex_check.isChecked(),
+            case_sensitive=case,
+            whole_word=word,
+            regex=regex,
             forward=True
         )
         
-        self._update_match_count(text, found)
+        self._update_match_count(text, found, (case, word, regex))
         
-        self.findRequested.emit(
-            text,
-            self.case_check.isChecked(),
-            self.word_check.isChecked(),
-            self.regex_check.isChecked(),
-            True
-        )
+        self.findRequested.emit(text, case, word, regex, True)
     
     def _find_prev(self):
         """Find previous occurrence."""
@@ -305,53 +436,107 @@ class SearchWidget(QWidget):
         if not text or not self._editor:
             return
         
+        case, word, regex = self._opts()
         found = self._editor.find(
             text,
-            case_sensitive=self.case_check.isChecked(),
-            whole_word=self.word_check.isChecked(),
-            regex=self.regex_check.isChecked(),
+            case_sensitive=case,
+            whole_word=word,
+            regex=regex,
             forward=False
         )
         
-        self._update_match_count(text, found)
+        self._update_match_count(text, found, (case, word, regex))
         
-        self.findRequested.emit(
-            text,
-            self.case_check.isChecked(),
-            self.word_check.isChecked(),
-            self.regex_check.isChecked(),
-            False
-        )
+        self.findRequested.emit(text, case, word, regex, False)
     
-    def _update_match_count(self, text: str, found: bool):
+    def _update_match_count(self, text: str, found: bool, opts: tuple = None):
         """Update the match count label."""
-        if not self._editor:
+        # The label isn't shown while the panel is closed (F3 still navigates)
+        if not self._editor or self.isHidden():
             return
         
-        # Count total matches
-        content = self._editor.text()
+        case, word, regex = opts or self._opts()
+        
+        # A literal longer than the whole document can't match; skip the text copy
+        if not regex and len(text) >= self._editor.document().characterCount():
+            self._count_generation += 1
+            self._on_match_count_ready(self._count_generation, 0)
+            return
         
-        if self.regex_check.isChecked():
-            import re
-            flags = 0 if self.case_check.isChecked() else re.IGNORECASE
-            try:
-                matches = len(re.findall(text, content, flags))
-            except re.error:
-                matches = 0
+        # Count total matches off the UI thread, on an immutable copy of the text
+        fold_case = False
+        if regex or word:
+            needle = _build_pattern(text, case, word, regex)
+            if needle is None:
+                # Invalid patterns are cached as None too; nothing to count
+                self._count_generation += 1
+                self._on_match_count_ready(self._count_generation, 0)
+                return
+        elif case or text.lower() == text.upper():
+            # Case-sensitive, or nothing in the needle has case: no lowercase copy needed
+            needle = text
+        else:
+            needle = text.lower()
+            fold_case = True
+        
+        size = self._editor.document().characterCount()
+        approximate = size > 2 * _COUNT_WINDOW_CHARS
+        if approximate:
+            # Huge document: count around the viewport without copying all of it
+            center = self._editor.firstVisiblePosition()
+            content = self._editor.textRange(
+                max(0, center - _COUNT_WINDOW_CHARS),
+                min(size - 1, center + _COUNT_WINDOW_CHARS),
+            )
+            revision = -1  # a window; never kept as the lowercase cache
         else:
-            if not self.case_check.isChecked():
-                content = content.lower()
-                text = text.lower()
-            matches = content.count(text)
+            content = self._editor_content()
+            revision = self._content_revision
+            # The lowercase copy is made on the worker, once per revision
+            if fold_case and self._content_lower is not None:
+                content = self._content_lower
+                fold_case = False
+        
+        self._count_generation += 1
+        task = MatchCountTask(self._count_generation, needle, content, fold_case)
+        task.revision = revision
+        task.approximate = approximate
+        task.signals.resultReady.connect(self._on_match_count_ready)
+        self._count_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_match_count_ready(self, generation: int, matches: int):
+        """Show a finished match count, unless a newer search superseded it."""
+        approximate = False
+        for task in [t for t in self._count_tasks if t.generation == generation]:
+            self._count_tasks.discard(task)
+            approximate = task.approximate
+            # Keep the lowercase copy the worker built, if the text hasn't changed since
+            if task.folded is not None and task.revision == self._content_revision:
+                self._content_lower = task.folded
+        if generation != self._count_generation:
+            return
         
         self._match_count = matches
         
         if matches == 0:
-            self.match_label.setText("No results")
-            self.match_label.setStyleSheet("color: #cc6666;")
+            self.match_label.setText("No results in view" if approximate else "No results")
+            self._set_match_label_style("color: #cc6666;")
+        elif approximate:
+            shown = f"{_MATCH_COUNT_CAP}+" if matches >= _MATCH_COUNT_CAP else matches
+            self.match_label.setText(f"~{shown} in view")
+            self._set_match_label_style("color: #888888;")
+        elif matches >= _MATCH_COUNT_CAP:
+            self.match_label.setText(f"{_MATCH_COUNT_CAP}+ results")
+            self._set_match_label_style("color: #888888;")
         else:
             self.match_label.setText(f"{matches} result{'s' if matches != 1 else ''}")
-            self.match_label.setStyleSheet("color: #888888;")
+            self._set_match_label_style("color: #888888;")
+    
+    def _set_match_label_style(self, style: str):
+        """Restyle the match label only when the style actually changes."""
+        if self.match_label.styleSheet() != style:
+            self.match_label.setStyleSheet(style)
     
     def _replace(self):
         """Replace current selection."""
@@ -365,7 +550,8 @@ class SearchWidget(QWidget):
         find_text = self.find_input.text()
         
         if selected:
-            if self.case_check.isChecked():
+            case, _, _ = self._opts()
+            if case:
                 matches = selected == find_text
             else:
                 matches = selected.lower() == find_text.lower()
@@ -388,32 +574,30 @@ class SearchWidget(QWidget):
         if not find_text:
             return
         
+        case, word, regex = self._opts()
         count = self._editor.replaceAll(
             find_text,
             replacement,
-            case_sensitive=self.case_check.isChecked(),
-            whole_word=self.word_check.isChecked(),
-            regex=self.regex_check.isChecked()
+            case_sensitive=case,
+            whole_word=word,
+            regex=regex
         )
         
         self.match_label.setText(f"Replaced {count}")
-        self.replaceAllRequested.emit(
-            find_text,
-            replacement,
-            self.case_check.isChecked(),
-            self.word_check.isChecked(),
-            self.regex_check.isChecked()
-        )
+        self.replaceAllRequested.emit(find_text, replacement, case, word, regex)
         
-        # Update count after replace
-        self._update_match_count(find_text, False)
+        # Nothing replaced means the buffer is unchanged, so there's nothing to recount.
+        # Otherwise rescan: new matches can span a replacement and its surroundings
+        if count:
+            self._update_match_count(find_text, False, (case, word, regex))
     
     def keyPressEvent(self, event):
         """Handle key presses."""
-        if event.key() == Qt.Key.Key_Escape:
+        key = event.key()
+        if key == _KEY_ESCAPE:
             self._close()
-        elif event.key() == Qt.Key.Key_F3:
-            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+        elif key == _KEY_F3:
+            if event.modifiers() & _MOD_SHIFT:
                 self._find_prev()
             else:
                 self._find_next()
@@ -422,49 +606,50 @@ class SearchWidget(QWidget):
     
     def setTheme(self, theme_name: str):
         """Set the search widget theme."""
-        if theme_name == 'light':
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #f3f3f3;
-                    color: #333333;
-                }
-                #findInput, #replaceInput {
-                    background-color: #ffffff;
-                    color: #333333;
-                    border: 1px solid #e0e0e0;
-                    padding: 6px 10px;
-                    border-radius: 3px;
-                }
-                #findInput:focus, #replaceInput:focus {
-                    border-color: #0e639c;
-                }
-                #matchLabel {
-                    color: #666666;
-                }
-                #navBtn, #closeBtn {
-                    background-color: transparent;
-                    color: #333333;
-                    border: none;
-                    border-radius: 3px;
-                }
-                #navBtn:hover, #closeBtn:hover {
-                    background-color: #e0e0e0;
-                }
-                #actionBtn {
-                    background-color: #0e639c;
-                    color: white;
-                    border: none;
-                    padding: 6px 12px;
-                    border-radius: 3px;
-                }
-                #optionCheck {
-                    color: #333333;
-                }
-                #toggleBtn {
-                    background-color: transparent;
-                    color: #666666;
-                    border: none;
-                }
-            """)
+        if theme_name != 'light':
+            theme_name = 'dark'
+        # Re-setting an identical stylesheet still repolishes every child
+        if theme_name == self._theme:
+            return
+        self._theme = theme_name
+        self.setStyleSheet(_LIGHT_QSS if theme_name == 'light' else _DARK_QSS)
+
+
+class MatchCountTaskSignals(QObject):
+    """Signals emitted by MatchCountTask (QRunnable can't define signals itself)."""
+    
+    resultReady = Signal(int, int)  # generation, match count
+
+
+class MatchCountTask(QRunnable):
+    """Worker that counts search matches off the UI thread."""
+    
+    def __init__(self, generation: int, needle, content: str, fold_case: bool = False):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = MatchCountTaskSignals()
+        self.generation = generation
+        self.revision = -1  # editor revision the content was taken at
+        self.folded = None  # lowercased content, when built by this task
+        self.approximate = False  # content is a window around the viewport
+        self._needle = needle  # compiled pattern or plain string
+        self._content = content
+        self._fold_case = fold_case
+    
+    def run(self):
+        """Count the matches and report back."""
+        needle = self._needle
+        if self._fold_case:
+            self.folded = self._content.lower()
+            self._content = self.folded
+        
+        if isinstance(needle, str):
+            matches = self._content.count(needle)
         else:
-            self._apply_style()
+            # Step through matches without collecting them
+            found_iter = needle.globalMatch(self._content)
+            matches = 0
+            while matches < _MATCH_COUNT_CAP and found_iter.hasNext():
+                found_iter.next()
+                matches += 1
+        self.signals.resultReady.emit(self.generation, matches)
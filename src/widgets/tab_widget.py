@@ -3,17 +3,80 @@ SuperSupText - Tab Widget
 Manages multiple editor tabs with close buttons, reordering, and modification indicators
 """
 
+import os
+import shutil
+import subprocess
+import sys
+from contextlib import contextmanager
+
 from PySide6.QtWidgets import (
-    QTabWidget, QTabBar, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QTabWidget, QTabBar, QWidget, QVBoxLayout, QHBoxLayout,
     QMenu, QMessageBox, QFileDialog, QSplitter
 )
-from PySide6.QtCore import Signal, Qt, QPoint
+from PySide6.QtCore import Signal, Qt, QPoint, QTimer, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QAction, QIcon
 
 from ..editor.code_editor import CodeEditor
 from ..editor.minimap import MiniMap
 from ..utils.file_utils import FileUtils
-from ..utils.settings import Settings
+from ..utils.settings import get_settings
+
+
+# Explorer executable, resolved once instead of on every "Reveal" (Windows only)
+_EXPLORER = (shutil.which('explorer') or 'explorer') if os.name == 'nt' else None
+
+# File manager launches are detached, so they neither wait on nor die with the editor
+_LAUNCH_KWARGS = {'close_fds': True}
+if os.name == 'nt':
+    _LAUNCH_KWARGS['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+else:
+    _LAUNCH_KWARGS['start_new_session'] = True
+
+# Files larger than this are read on the thread pool; smaller reads are quicker than the round trip
+_ASYNC_READ_BYTES = 1 << 20
+
+# Static tab stylesheet, built once for every tab widget
+_TAB_QSS = """
+    QTabWidget::pane {
+        border: none;
+        background-color: #1e1e1e;
+    }
+    QTabBar::tab {
+        background-color: #2d2d2d;
+        color: #bbbbbb;
+        padding: 8px 28px 8px 12px;
+        border: none;
+        border-right: 1px solid #1e1e1e;
+        min-width: 80px;
+        max-width: 200px;
+    }
+    QTabBar::tab:selected {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #3c3c3c;
+    }
+    QTabBar::close-button {
+        subcontrol-position: right;
+        subcontrol-origin: padding;
+        margin-right: 4px;
+        width: 16px;
+        height: 16px;
+        border-radius: 3px;
+        background-color: transparent;
+        border: 1px solid #666666;
+    }
+    QTabBar::close-button:hover {
+        background-color: #c42b1c;
+        border-color: #c42b1c;
+    }
+"""
+
+
+def _strip_modified(title: str) -> str:
+    """Drop the unsaved-changes marker; rstrip would also eat a '*' that ends the name."""
+    return title[:-1] if title[-1:] == '*' else title
 
 
 class TabBar(QTabBar):
@@ -24,11 +87,29 @@ class TabBar(QTabBar):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Owning TabWidget, resolved once rather than through parent() on every action
+        self._tab_widget = parent
         self.setMovable(True)
         self.setTabsClosable(True)
         self.setElideMode(Qt.TextElideMode.ElideRight)
         self.setExpanding(False)
         self.setDocumentMode(True)
+        self._setup_context_menu()
+    
+    def _setup_context_menu(self):
+        """Create the context menu once; each invocation only retargets it."""
+        self._menu_index = -1
+        self._menu = QMenu(self)
+        
+        self._menu.addAction("Close").triggered.connect(self._menu_close)
+        self._menu.addAction("Close Others").triggered.connect(self._menu_close_others)
+        self._menu.addAction("Close All").triggered.connect(self._menu_close_all)
+        self._menu.addSeparator()
+        self._menu.addAction("Close to the Right").triggered.connect(self._menu_close_right)
+        self._menu.addAction("Close to the Left").triggered.connect(self._menu_close_left)
+        self._menu.addSeparator()
+        self._menu.addAction("Copy Path").triggered.connect(self._menu_copy_path)
+        self._menu.addAction("Reveal in Explorer").triggered.connect(self._menu_reveal)
     
     def mousePressEvent(self, event):
         """Handle middle-click to close tab."""
@@ -45,34 +126,36 @@ class TabBar(QTabBar):
         if index < 0:
             return
         
-        menu = QMenu(self)
-        
-        close_action = menu.addAction("Close")
-        close_others_action = menu.addAction("Close Others")
-        close_all_action = menu.addAction("Close All")
-        menu.addSeparator()
-        close_right_action = menu.addAction("Close to the Right")
-        close_left_action = menu.addAction("Close to the Left")
-        menu.addSeparator()
-        copy_path_action = menu.addAction("Copy Path")
-        reveal_action = menu.addAction("Reveal in Explorer")
-        
-        action = menu.exec_(event.globalPos())
-        
-        if action == close_action:
-            self.tabCloseRequested.emit(index)
-        elif action == close_others_action:
-            self.parent()._close_other_tabs(index)
-        elif action == close_all_action:
-            self.parent()._close_all_tabs()
-        elif action == close_right_action:
-            self.parent()._close_tabs_to_right(index)
-        elif action == close_left_action:
-            self.parent()._close_tabs_to_left(index)
-        elif action == copy_path_action:
-            self.parent()._copy_path(index)
-        elif action == reveal_action:
-            self.parent()._reveal_in_explorer(index)
+        self._menu_index = index
+        self._menu.exec_(event.globalPos())
+    
+    def _menu_close(self):
+        """Close the targeted tab."""
+        self.tabCloseRequested.emit(self._menu_index)
+    
+    def _menu_close_others(self):
+        """Close every tab but the targeted one."""
+        self._tab_widget._close_other_tabs(self._menu_index)
+    
+    def _menu_close_all(self):
+        """Close all tabs."""
+        self._tab_widget._close_all_tabs()
+    
+    def _menu_close_right(self):
+        """Close the tabs right of the targeted one."""
+        self._tab_widget._close_tabs_to_right(self._menu_index)
+    
+    def _menu_close_left(self):
+        """Close the tabs left of the targeted one."""
+        self._tab_widget._close_tabs_to_left(self._menu_index)
+    
+    def _menu_copy_path(self):
+        """Copy the targeted tab's file path."""
+        self._tab_widget._copy_path(self._menu_index)
+    
+    def _menu_reveal(self):
+        """Reveal the targeted tab's file."""
+        self._tab_widget._reveal_in_explorer(self._menu_index)
 
 
 class EditorContainer(QWidget):
@@ -80,7 +163,9 @@ class EditorContainer(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.settings = Settings()
+        self.settings = get_settings()
+        # Set by session restore when it puts an unsaved buffer in; it then wins over the file
+        self.restored_buffer = False
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -90,15 +175,30 @@ class EditorContainer(QWidget):
         self.editor = CodeEditor(self)
         layout.addWidget(self.editor)
         
-        # Minimap
-        self.minimap = MiniMap(self.editor, self)
-        self.minimap.setVisible(self.settings.get('editor/show_minimap'))
-        self.minimap.positionClicked.connect(self._on_minimap_clicked)
-        layout.addWidget(self.minimap)
+        # Minimap, built the first time it is shown; hidden tabs never pay for one
+        self.minimap = None
+        self.setMinimapVisible(self.settings.get('editor/show_minimap'))
+        
+        self.settings.valueChanged.connect(self._on_setting_changed)
+    
+    def setMinimapVisible(self, visible: bool):
+        """Show or hide the minimap, creating it on first show."""
+        if self.minimap is None:
+            if not visible:
+                return
+            self.minimap = MiniMap(self.editor, self)
+            self.minimap.positionClicked.connect(self._on_minimap_clicked)
+            self.layout().addWidget(self.minimap)
+        self.minimap.setVisible(visible)
     
     def _on_minimap_clicked(self, line: int):
         """Handle minimap click."""
         self.editor.goToLine(line)
+    
+    def _on_setting_changed(self, key: str, value):
+        """Show or hide the minimap when the setting changes."""
+        if key == 'editor/show_minimap':
+            self.setMinimapVisible(bool(value))
 
 
 class TabWidget(QTabWidget):
@@ -116,11 +216,44 @@ class TabWidget(QTabWidget):
     # Signals
     currentFileChanged = Signal(str)  # filepath
     fileModified = Signal(str, bool)  # filepath, is_modified
+    currentCursorChanged = Signal(int, int)  # line, column of the current editor
+    tabCreated = Signal(QWidget)  # editor container
+    tabClosed = Signal(QWidget)  # editor container
+    fileLoaded = Signal(QWidget)  # editor container whose background read finished
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.settings = Settings()
-        self._file_tabs = {}  # filepath -> tab index
+        self.settings = get_settings()
+        # filepath -> editor container; indices shift on close and drag, containers don't
+        self._open_files = {}
+        # container -> FileReadTask still reading its file; kept until the read reports back
+        self._read_tasks = {}
+        # Files being read inline; the error dialog's event loop can deliver another open
+        self._opening = set()
+        
+        # Untitled-N numbers in use, so a new name needs no scan of the tab titles
+        self._untitled_numbers = {}  # container -> N
+        self._untitled_used = set()
+        self._untitled_next = 1  # lowest number that may be free
+        
+        self._clipboard = QApplication.clipboard()
+        
+        # Containers whose '*' suffix may be stale; flushed together on the next frame
+        self._pending_mod_updates = set()
+        self._mod_update_timer = QTimer(self)
+        self._mod_update_timer.setSingleShot(True)
+        self._mod_update_timer.setInterval(16)
+        self._mod_update_timer.timeout.connect(self._flush_modification_titles)
+        
+        # Set while a batch close runs, so the current tab is announced once at the end
+        self._closing_batch = False
+        # (container, filepath) last sent as currentFileChanged
+        self._current_file_key = None
+        
+        # Editors in tab order, so whole-tab queries skip a widget() lookup per tab
+        self._editors = []
+        # Editors with unsaved changes, kept current from modificationChanged
+        self._dirty_editors = set()
         
         # Setup custom tab bar
         self._tab_bar = TabBar(self)
@@ -128,6 +261,7 @@ class TabWidget(QTabWidget):
         
         # Connect signals
         self._tab_bar.tabCloseRequested.connect(self.closeTab)
+        self._tab_bar.tabMoved.connect(self._on_tab_moved)
         self.currentChanged.connect(self._on_current_changed)
         
         # Style
@@ -135,42 +269,7 @@ class TabWidget(QTabWidget):
     
     def _apply_style(self):
         """Apply tab widget styling."""
-        self.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background-color: #1e1e1e;
-            }
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #bbbbbb;
-                padding: 8px 28px 8px 12px;
-                border: none;
-                border-right: 1px solid #1e1e1e;
-                min-width: 80px;
-                max-width: 200px;
-            }
-            QTabBar::tab:selected {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #3c3c3c;
-            }
-            QTabBar::close-button {
-                subcontrol-position: right;
-                subcontrol-origin: padding;
-                margin-right: 4px;
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                background-color: transparent;
-                border: 1px solid #666666;
-            }
-            QTabBar::close-button:hover {
-                background-color: #c42b1c;
-                border-color: #c42b1c;
-            }
-        """)
+        self.setStyleSheet(_TAB_QSS)
     
     def newTab(self, filepath: str = None) -> int:
         """
@@ -183,9 +282,26 @@ class TabWidget(QTabWidget):
             Index of the new tab
         """
         # Check if file is already open
-        if filepath and filepath in self._file_tabs:
-            self.setCurrentIndex(self._file_tabs[filepath])
-            return self._file_tabs[filepath]
+        if filepath and filepath in self._open_files:
+            index = self.indexOf(self._open_files[filepath])
+            self.setCurrentIndex(index)
+            return index
+        if filepath in self._opening:
+            return -1
+        
+        # A large file starts reading before the widgets are built, so the two overlap.
+        # The result is queued to this thread and can't arrive before the tab is registered.
+        task = None
+        if filepath:
+            try:
+                load_async = os.path.getsize(filepath) > _ASYNC_READ_BYTES
+            except OSError:
+                load_async = False  # read_file reports the error below
+            
+            if load_async:
+                task = FileReadTask(filepath)
+                task.signals.finished.connect(self._on_read_finished)
+                QThreadPool.globalInstance().start(task)
         
         # Create editor container
         container = EditorContainer(self)
@@ -194,30 +310,29 @@ class TabWidget(QTabWidget):
         # Set up the tab
         if filepath:
             # Open existing file
-            content, encoding = FileUtils.read_file(filepath)
-            if content is not None:
-                editor.setText(content)
-                editor.encoding = encoding
+            if task is not None:
                 editor.filepath = filepath
-                editor.setModified(False)
-                
-                # Set language
-                language = FileUtils.get_language_from_extension(filepath)
-                editor.set_language(language)
-                
-                # Update recent files
-                self.settings.add_recent_file(filepath)
+                editor.setReadOnly(True)
+                editor.setPlaceholderText("Loading\u2026")
+                self._read_tasks[container] = task
             else:
-                QMessageBox.warning(self, "Error", f"Could not open file:\n{encoding}")
-                return -1
+                self._opening.add(filepath)
+                try:
+                    content, encoding = FileUtils.read_file(filepath)
+                    if content is None:
+                        container.deleteLater()
+                        QMessageBox.warning(self, "Error", f"Could not open file:\n{encoding}")
+                        return -1
+                finally:
+                    self._opening.discard(filepath)
+                self._apply_file_content(editor, filepath, content, encoding)
             
             # Tab title
-            import os
             title = os.path.basename(filepath)
         else:
             # New untitled file
             editor.filepath = None
-            title = self._get_untitled_name()
+            title = self._get_untitled_name(container)
         
         # Add tab
         index = self.addTab(container, title)
@@ -225,32 +340,81 @@ class TabWidget(QTabWidget):
         
         # Track file
         if filepath:
-            self._file_tabs[filepath] = index
+            self._open_files[filepath] = container
         
         # Connect editor signals
-        editor.modificationChanged.connect(
-            lambda modified: self._on_modification_changed(index, modified)
-        )
+        editor.modificationChanged.connect(self._on_modification_changed)
         editor.cursorPositionChanged_custom.connect(self._on_cursor_changed)
         editor.fileDropped.connect(self._on_file_dropped)
         
+        self.tabCreated.emit(container)
+        
         editor.setFocus()
         return index
     
-    def _get_untitled_name(self) -> str:
-        """Get a unique untitled name."""
-        existing = []
-        for i in range(self.count()):
-            text = self.tabText(i)
-            if text.startswith("Untitled"):
-                existing.append(text)
+    def _apply_file_content(self, editor, filepath: str, content: str, encoding: str):
+        """Fill an editor with a file's content as read from disk."""
+        editor.setText(content)
+        editor.encoding = encoding
+        editor.filepath = filepath
+        editor.setModified(False)
+        
+        # Set language
+        language = FileUtils.get_language_from_extension(filepath)
+        editor.set_language(language)
+        
+        # Update recent files
+        self.settings.add_recent_file(filepath)
+    
+    def _on_read_finished(self, filepath: str, content, encoding: str):
+        """Apply the result of a background file read to its tab."""
+        signals = self.sender()
+        container = next(c for c, t in self._read_tasks.items() if t.signals is signals)
+        del self._read_tasks[container]
+        
+        # Nothing to fill if the tab was closed while the read was running
+        if self.indexOf(container) < 0:
+            return
+        
+        editor = container.editor
+        editor.setReadOnly(False)
+        editor.setPlaceholderText("")
+        
+        if content is None:
+            self.closeTab(self.indexOf(container))
+            QMessageBox.warning(self, "Error", f"Could not open file:\n{encoding}")
+            return
         
-        counter = 1
-        while f"Untitled-{counter}" in existing:
+        if container.restored_buffer:
+            # An unsaved session buffer was restored while loading; it wins over the disk copy
+            editor.encoding = encoding
+            editor.set_language(FileUtils.get_language_from_extension(filepath))
+        else:
+            self._apply_file_content(editor, filepath, content, encoding)
+        self.fileLoaded.emit(container)
+    
+    def isLoading(self, index: int) -> bool:
+        """Check whether the tab's file is still being read."""
+        return self.widget(index) in self._read_tasks
+    
+    def _get_untitled_name(self, container) -> str:
+        """Get a unique untitled name, reusing the lowest free number."""
+        counter = self._untitled_next
+        while counter in self._untitled_used:
             counter += 1
         
+        self._untitled_used.add(counter)
+        self._untitled_numbers[container] = counter
+        self._untitled_next = counter + 1
         return f"Untitled-{counter}"
     
+    def _release_untitled_name(self, container):
+        """Free a container's Untitled-N number for reuse."""
+        counter = self._untitled_numbers.pop(container, None)
+        if counter is not None:
+            self._untitled_used.discard(counter)
+            self._untitled_next = min(self._untitled_next, counter)
+    
     def closeTab(self, index: int) -> bool:
         """
         Close a tab.
@@ -272,7 +436,7 @@ class TabWidget(QTabWidget):
             result = QMessageBox.question(
                 self,
                 "Unsaved Changes",
-                f"Do you want to save changes to '{self.tabText(index).rstrip('*')}'?",
+                f"Do you want to save changes to '{self.tabTitle(index)}'?",
                 QMessageBox.StandardButton.Save |
                 QMessageBox.StandardButton.Discard |
                 QMessageBox.StandardButton.Cancel
@@ -284,18 +448,74 @@ class TabWidget(QTabWidget):
             elif result == QMessageBox.StandardButton.Cancel:
                 return False
         
-        # Remove from file tracking
-        if editor.filepath and editor.filepath in self._file_tabs:
-            del self._file_tabs[editor.filepath]
+        self._remove_tab(index)
+        return True
+    
+    def closeTabs(self, indices) -> bool:
+        """
+        Close several tabs, asking once about all of their unsaved changes.
         
-        # Remove tab
-        self.removeTab(index)
+        Args:
+            indices: Tab indices to close
+            
+        Returns:
+            True if all were closed, False if cancelled
+        """
+        # Last to first, so removing a tab never shifts one still to visit
+        indices = sorted(set(indices), reverse=True)
+        modified = [i for i in indices if self._editors[i].isModified()]
+        
+        # A single unsaved tab gets the usual per-file prompt
+        if len(modified) < 2:
+            with self._batch_tab_closes():
+                for i in indices:
+                    if not self.closeTab(i):
+                        return False
+            return True
         
-        # Update file tracking indices
-        self._update_file_indices()
+        box = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Unsaved Changes",
+            f"Do you want to save changes to {len(modified)} files?",
+            QMessageBox.StandardButton.Save |
+            QMessageBox.StandardButton.Discard |
+            QMessageBox.StandardButton.Cancel,
+            self
+        )
+        box.setDetailedText("\n".join(self.tabTitle(i) for i in reversed(modified)))
+        result = box.exec()
         
+        if result == QMessageBox.StandardButton.Cancel:
+            return False
+        if result == QMessageBox.StandardButton.Save:
+            # Saving keeps indices stable; stop at the first failure or cancelled Save As
+            for i in reversed(modified):
+                if not self.saveTab(i):
+                    return False
+        
+        with self._batch_tab_closes():
+            for i in indices:
+                self._remove_tab(i)
         return True
     
+    def _remove_tab(self, index: int):
+        """Remove a tab without asking about unsaved changes."""
+        container = self.widget(index)
+        editor = container.editor
+        
+        # Remove from file tracking
+        if editor.filepath:
+            self._open_files.pop(editor.filepath, None)
+        
+        # Remove tab
+        self._release_untitled_name(container)
+        self._pending_mod_updates.discard(container)
+        self._dirty_editors.discard(editor)
+        if self._current_file_key and self._current_file_key[0] is container:
+            self._current_file_key = None
+        self.removeTab(index)
+        self.tabClosed.emit(container)
+    
     def saveTab(self, index: int = None) -> bool:
         """
         Save the tab at the given index.
@@ -309,7 +529,8 @@ class TabWidget(QTabWidget):
         if index is None:
             index = self.currentIndex()
         
-        if index < 0:
+        # A tab still loading holds no text yet; writing it would empty the file
+        if index < 0 or self.isLoading(index):
             return False
         
         container = self.widget(index)
@@ -343,7 +564,8 @@ class TabWidget(QTabWidget):
         if index is None:
             index = self.currentIndex()
         
-        if index < 0:
+        # A tab still loading holds no text yet; writing it would empty the file
+        if index < 0 or self.isLoading(index):
             return False
         
         container = self.widget(index)
@@ -359,22 +581,21 @@ class TabWidget(QTabWidget):
         if not filepath:
             return False
         
-        # Remove old tracking
-        if editor.filepath and editor.filepath in self._file_tabs:
-            del self._file_tabs[editor.filepath]
-        
         # Save file
         success, message = FileUtils.write_file(filepath, editor.text())
         if success:
+            # Remove old tracking
+            if editor.filepath:
+                self._open_files.pop(editor.filepath, None)
             editor.filepath = filepath
             editor.setModified(False)
             
             # Update tab title
-            import os
+            self._release_untitled_name(container)
             self.setTabText(index, os.path.basename(filepath))
             
             # Update tracking
-            self._file_tabs[filepath] = index
+            self._open_files[filepath] = container
             
             # Set language
             language = FileUtils.get_language_from_extension(filepath)
@@ -396,6 +617,10 @@ class TabWidget(QTabWidget):
             return container.editor
         return None
     
+    def tabTitle(self, index: int) -> str:
+        """Get the tab's title without the unsaved-changes marker."""
+        return _strip_modified(self.tabText(index))
+    
     def editorAt(self, index: int) -> CodeEditor:
         """Get the editor at the given index."""
         container = self.widget(index)
@@ -405,98 +630,168 @@ class TabWidget(QTabWidget):
     
     def _on_current_changed(self, index: int):
         """Handle current tab change."""
+        if self._closing_batch:
+            return
         if index >= 0:
-            editor = self.editorAt(index)
-            if editor:
-                self.currentFileChanged.emit(editor.filepath or "")
+            container = self.widget(index)
+            if container:
+                editor = container.editor
+                # currentChanged also fires when closing a tab to the left shifts the index
+                key = (container, editor.filepath or "")
+                if key != self._current_file_key:
+                    self._current_file_key = key
+                    self.currentFileChanged.emit(key[1])
                 editor.setFocus()
     
-    def _on_modification_changed(self, index: int, modified: bool):
-        """Handle modification state change."""
-        if index < 0 or index >= self.count():
+    def _on_modification_changed(self, modified: bool):
+        """Handle modification state change of the sending editor."""
+        editor = self.sender()
+        container = editor.parent()
+        if self.indexOf(container) < 0:
             return
         
-        title = self.tabText(index)
-        if modified and not title.endswith('*'):
-            self.setTabText(index, title + '*')
-        elif not modified and title.endswith('*'):
-            self.setTabText(index, title[:-1])
+        if modified:
+            self._dirty_editors.add(editor)
+        else:
+            self._dirty_editors.discard(editor)
         
-        editor = self.editorAt(index)
-        if editor:
-            self.fileModified.emit(editor.filepath or "", modified)
+        # Each setTabText re-measures every tab, so bursts are coalesced into one pass
+        self._pending_mod_updates.add(container)
+        if not self._mod_update_timer.isActive():
+            self._mod_update_timer.start()
+        
+        self.fileModified.emit(editor.filepath or "", modified)
+    
+    def _flush_modification_titles(self):
+        """Apply pending '*' suffix changes from each editor's current state."""
+        pending = self._pending_mod_updates
+        self._pending_mod_updates = set()
+        
+        with self._batch_tab_updates():
+            for container in pending:
+                # Resolved now; the tab may have moved or closed since the signal
+                index = self.indexOf(container)
+                if index < 0:
+                    continue
+                
+                modified = container.editor.isModified()
+                title = self.tabText(index)
+                if modified != (title[-1:] == '*'):
+                    self.setTabText(index, title + '*' if modified else title[:-1])
     
     def _on_cursor_changed(self, line: int, column: int):
-        """Handle cursor position change - for minimap update."""
-        pass
+        """Forward cursor moves of the current editor only."""
+        if self.sender() is self.currentEditor():
+            self.currentCursorChanged.emit(line, column)
     
     def _on_file_dropped(self, filepath: str):
         """Handle file dropped on editor - open it in new tab."""
         self.newTab(filepath)
     
-    def _update_file_indices(self):
-        """Update file tracking after tab reorder or removal."""
-        self._file_tabs.clear()
-        for i in range(self.count()):
-            editor = self.editorAt(i)
-            if editor and editor.filepath:
-                self._file_tabs[editor.filepath] = i
+    @contextmanager
+    def _batch_tab_updates(self):
+        """Suspend repaints while several tabs are removed, then repaint once."""
+        was_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(was_enabled)
+    
+    @contextmanager
+    def _batch_tab_closes(self):
+        """Close several tabs with one repaint and one current-tab notification."""
+        # Only our own handler is held back; tabClosed and currentChanged still reach listeners
+        current = self.currentWidget()
+        self._closing_batch = True
+        try:
+            with self._batch_tab_updates():
+                yield
+        finally:
+            self._closing_batch = False
+        if self.currentWidget() is not current:
+            self._on_current_changed(self.currentIndex())
     
     def _close_other_tabs(self, keep_index: int):
         """Close all tabs except the specified one."""
-        for i in range(self.count() - 1, -1, -1):
-            if i != keep_index:
-                self.closeTab(i)
+        self.closeTabs(i for i in range(self.count()) if i != keep_index)
     
     def _close_all_tabs(self):
         """Close all tabs."""
-        for i in range(self.count() - 1, -1, -1):
-            if not self.closeTab(i):
-                break
+        self.closeTabs(range(self.count()))
     
     def _close_tabs_to_right(self, index: int):
         """Close all tabs to the right of the specified one."""
-        for i in range(self.count() - 1, index, -1):
-            self.closeTab(i)
+        self.closeTabs(range(index + 1, self.count()))
     
     def _close_tabs_to_left(self, index: int):
         """Close all tabs to the left of the specified one."""
-        for i in range(index - 1, -1, -1):
-            self.closeTab(i)
+        self.closeTabs(range(index))
     
     def _copy_path(self, index: int):
         """Copy file path to clipboard."""
-        from PySide6.QtWidgets import QApplication
-        
         editor = self.editorAt(index)
         if editor and editor.filepath:
-            QApplication.clipboard().setText(editor.filepath)
+            self._clipboard.setText(editor.filepath)
     
     def _reveal_in_explorer(self, index: int):
         """Open file location in system explorer."""
-        import os
-        import subprocess
-        
         editor = self.editorAt(index)
         if editor and editor.filepath:
+            # Popen returns once the launcher is started; run() blocked the UI until it exited
             if os.name == 'nt':  # Windows
-                subprocess.run(['explorer', '/select,', editor.filepath])
-            elif os.name == 'posix':  # Linux/Mac
-                subprocess.run(['xdg-open', os.path.dirname(editor.filepath)])
+                argv = [_EXPLORER, '/select,', editor.filepath]
+            elif sys.platform == 'darwin':  # Mac: Finder selects the file itself
+                argv = ['open', '-R', editor.filepath]
+            elif os.name == 'posix':  # Linux
+                argv = ['xdg-open', os.path.dirname(editor.filepath)]
+            else:
+                return
+            subprocess.Popen(argv, **_LAUNCH_KWARGS)
+    
+    def tabInserted(self, index: int):
+        """Track the new tab's editor."""
+        super().tabInserted(index)
+        self._editors.insert(index, self.widget(index).editor)
+    
+    def tabRemoved(self, index: int):
+        """Forget the removed tab's editor."""
+        super().tabRemoved(index)
+        del self._editors[index]
+    
+    def _on_tab_moved(self, from_index: int, to_index: int):
+        """Keep the editor list in tab order after a drag."""
+        self._editors.insert(to_index, self._editors.pop(from_index))
+    
+    def editors(self) -> list:
+        """Get the editors of all tabs, in tab order."""
+        return list(self._editors)
     
     def getOpenFiles(self) -> list:
         """Get list of open file paths."""
-        files = []
-        for i in range(self.count()):
-            editor = self.editorAt(i)
-            if editor and editor.filepath:
-                files.append(editor.filepath)
-        return files
+        return [editor.filepath for editor in self._editors if editor.filepath]
     
     def hasUnsavedChanges(self) -> bool:
         """Check if any tab has unsaved changes."""
-        for i in range(self.count()):
-            editor = self.editorAt(i)
-            if editor and editor.isModified():
-                return True
-        return False
+        return bool(self._dirty_editors)
+
+
+class FileReadTaskSignals(QObject):
+    """Signals emitted by FileReadTask (QRunnable can't define signals itself)."""
+    
+    finished = Signal(str, object, str)  # filepath, content (None on failure), encoding or error
+
+
+class FileReadTask(QRunnable):
+    """Worker that reads and decodes a file off the UI thread."""
+    
+    def __init__(self, filepath: str):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = FileReadTaskSignals()
+        self.filepath = filepath
+    
+    def run(self):
+        """Read the file and report back."""
+        content, encoding = FileUtils.read_file(self.filepath)
+        self.signals.finished.emit(self.filepath, content, encoding)